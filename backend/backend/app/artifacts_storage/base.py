@@ -10,6 +10,10 @@ class Storage(Protocol):
 
     def put_file(self, key: str, src_path: str) -> None: ...
 
+    def put_files(self, pairs: list[tuple[str, str]]) -> dict[str, Exception | None]:
+        """Upload every (key, src_path) pair; maps each key to None or the error it hit."""
+        ...
+
     def list(self, prefix: str = "") -> list[str]: ...
 
     def delete(self, key: str) -> None: ...
@@ -29,6 +29,16 @@ class FSStorage:
         dst.parent.mkdir(parents=True, exist_ok=True)
         copy2(src_path, dst)
 
+    def put_files(self, pairs: list[tuple[str, str]]) -> dict[str, Exception | None]:
+        results: dict[str, Exception | None] = {}
+        for key, src_path in pairs:
+            try:
+                self.put_file(key, src_path)
+                results[key] = None
+            except Exception as e:  # noqa: BLE001
+                results[key] = e
+        return results
+
     def list(self, prefix: str = "") -> list[str]:
         prefix = prefix.lstrip("/") if prefix else ""
         root = self.root
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any, Optional
 
 MISSING_BOTO3_MSG = "S3 storage selected but boto3 is not installed. Install boto3 or switch to FS storage."
@@ -71,6 +72,15 @@ class S3Storage:
     def put_file(self, key: str, src_path: str) -> None:
         self.client.upload_file(src_path, self.bucket, key)
 
+    def put_files(self, pairs: list[tuple[str, str]]) -> dict[str, Exception | None]:
+        # boto3 clients are thread-safe; upload in parallel over the client's
+        # connection pool instead of one request after another
+        if not pairs:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(len(pairs), 8)) as pool:
+            futures = {key: pool.submit(self.put_file, key, src_path) for key, src_path in pairs}
+        return {key: f.exception() for key, f in futures.items()}
+
     def list(self, prefix: str = "") -> list[str]:
         kwargs = {"Bucket": self.bucket}
         if prefix:
@@ -6,7 +6,7 @@ import json
 from datetime import datetime, timedelta, timezone
 from typing import Tuple
 
-from app.db import store_refresh, is_refresh_active
+from app.db import bump_refresh_version, get_refresh_version
 
 
 def _secret() -> bytes:
@@ -44,13 +44,18 @@ def _decode(token: str) -> dict:
         raise ValueError("invalid token") from e
 
 
+def _now() -> datetime:
+    # Single source of "now" for minting and expiry checks; tests monkeypatch it
+    return datetime.now(timezone.utc)
+
+
 def new_jti() -> str:
     return _b64url(os.urandom(16))
 
 
 def issue_access(user_id: str) -> Tuple[str, str]:
     exp_min = int(os.getenv("ACCESS_EXPIRES_MIN", "15"))
-    now = datetime.now(timezone.utc)
+    now = _now()
     exp = now + timedelta(minutes=exp_min)
     claims = {"sub": user_id, "typ": "access", "exp": int(exp.timestamp()), "jti": new_jti()}
     tok = _encode(claims)
@@ -58,13 +63,18 @@ def issue_access(user_id: str) -> Tuple[str, str]:
 
 
 def issue_refresh(user_id: str) -> Tuple[str, str, str]:
+    """Mint a refresh token stamped with the user's current refresh version.
+
+    Nothing is stored per token: bumping the version (see rotate_refresh /
+    revoke_refresh_tokens) invalidates every token minted before it.
+    """
     days = int(os.getenv("REFRESH_EXPIRES_DAYS", "14"))
-    now = datetime.now(timezone.utc)
+    now = _now()
     exp = now + timedelta(days=days)
     jti = new_jti()
-    claims = {"sub": user_id, "typ": "refresh", "exp": int(exp.timestamp()), "jti": jti}
+    ver = get_refresh_version(user_id) or 0
+    claims = {"sub": user_id, "typ": "refresh", "exp": int(exp.timestamp()), "jti": jti, "ver": ver}
     tok = _encode(claims)
-    store_refresh(user_id, jti, now.isoformat())
     return tok, jti, exp.isoformat()
 
 
@@ -72,12 +82,29 @@ def verify_refresh(token: str) -> Tuple[str, str]:
     payload = _decode(token)
     if payload.get("typ") != "refresh":
         raise ValueError("wrong type")
-    if int(payload.get("exp", 0)) < int(datetime.now(timezone.utc).timestamp()):
+    if int(payload.get("exp", 0)) < int(_now().timestamp()):
         raise ValueError("expired")
     sub = payload.get("sub")
     jti = payload.get("jti")
     if not sub or not jti:
         raise ValueError("invalid claims")
-    if not is_refresh_active(jti):
+    # One indexed read of the user row, regardless of how many tokens were revoked
+    if payload.get("ver") != get_refresh_version(str(sub)):
         raise ValueError("revoked")
     return str(sub), str(jti)
+
+
+def rotate_refresh(token: str) -> Tuple[str, str, str]:
+    """Exchange a valid refresh token for a new one; the old token stops verifying.
+
+    Returns (user_id, new_token, expires_at_iso). Raises ValueError like verify_refresh.
+    """
+    user_id, _jti = verify_refresh(token)
+    bump_refresh_version(user_id)
+    tok, _jti, exp = issue_refresh(user_id)
+    return user_id, tok, exp
+
+
+def revoke_refresh_tokens(user_id: str) -> None:
+    """Log user_id out everywhere by invalidating all of their refresh tokens."""
+    bump_refresh_version(user_id)
@@ -5,7 +5,8 @@ from datetime import datetime
 import uuid
 
 from ..db import get_conn
-from .security import hash_password, verify_password, create_access_token, create_refresh_token, decode, JWT_SECRET, get_current_user
+from .refresh import issue_refresh, revoke_refresh_tokens, rotate_refresh, verify_refresh
+from .security import hash_password, verify_password, create_access_token, get_current_user
 
 router = APIRouter()
 
@@ -68,21 +69,30 @@ def login(req: LoginReq):
         user_id = row['id']
         return Tokens(
             access_token=create_access_token(user_id),
-            refresh_token=create_refresh_token(user_id),
+            refresh_token=issue_refresh(user_id)[0],
         )
     finally:
         conn.close()
 
 
-@router.post('/refresh', response_model=dict)
+@router.post('/refresh', response_model=Tokens)
 def refresh(req: RefreshReq):
-    payload = decode(req.refresh_token, JWT_SECRET)
-    if payload.get('type') != 'refresh':
-        raise HTTPException(status_code=401, detail='Invalid token type')
-    sub = payload.get('sub')
-    if not sub:
-        raise HTTPException(status_code=401, detail='Invalid token')
-    return {"access_token": create_access_token(sub)}
+    # Rotation: the presented token is invalidated and replaced
+    try:
+        sub, refresh_token, _exp = rotate_refresh(req.refresh_token)
+    except ValueError:
+        raise HTTPException(status_code=401, detail='Invalid refresh token')
+    return Tokens(access_token=create_access_token(sub), refresh_token=refresh_token)
+
+
+@router.post('/logout')
+def logout(req: RefreshReq):
+    try:
+        sub, _jti = verify_refresh(req.refresh_token)
+    except ValueError:
+        raise HTTPException(status_code=401, detail='Invalid refresh token')
+    revoke_refresh_tokens(sub)
+    return {"ok": True}
 
 
 from ..plans.entitlements import get_plan_spec
@@ -15,6 +15,8 @@ ALGO = 'HS256'
 JWT_SECRET = os.getenv('JWT_SECRET', 'dev-secret-change-me')
 ACCESS_EXPIRES_MIN = int(os.getenv('ACCESS_EXPIRES_MIN', '30'))
 REFRESH_EXPIRES_DAYS = int(os.getenv('REFRESH_EXPIRES_DAYS', '30'))
+# Stored hashes don't record the count: changing it invalidates existing ones
+PBKDF2_ITERATIONS = 200_000
 
 
 def b64url(data: bytes) -> str:
@@ -52,7 +54,7 @@ def decode(token: str, secret: str) -> Dict[str, Any]:
 
 def hash_password(pw: str) -> str:
     salt = secrets.token_bytes(16)
-    dk = hashlib.pbkdf2_hmac('sha256', pw.encode('utf-8'), salt, 200_000)
+    dk = hashlib.pbkdf2_hmac('sha256', pw.encode('utf-8'), salt, PBKDF2_ITERATIONS)
     return b64url(salt) + '.' + b64url(dk)
 
 
@@ -63,7 +65,7 @@ def verify_password(pw: str, hashed: str) -> bool:
         expected = b64urldecode(dk_b64)
     except Exception:
         return False
-    dk = hashlib.pbkdf2_hmac('sha256', pw.encode('utf-8'), salt, 200_000)
+    dk = hashlib.pbkdf2_hmac('sha256', pw.encode('utf-8'), salt, PBKDF2_ITERATIONS)
     return hmac.compare_digest(dk, expected)
 
 
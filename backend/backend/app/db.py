@@ -1,15 +1,20 @@
 from __future__ import annotations
+import os
 import sqlite3
 from pathlib import Path
 from typing import Iterator, Optional, Any, Dict
 from typing import List
 
-DB_PATH = Path(__file__).resolve().parents[1] / 'data' / 'app.db'
-DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+# APP_DB_PATH lets the test suite point the app at its own database, either a
+# file path or a SQLite URI such as "file:testdb?mode=memory&cache=shared"
+DB_PATH = Path(os.getenv("APP_DB_PATH") or Path(__file__).resolve().parents[1] / 'data' / 'app.db')
+DB_IS_URI = str(DB_PATH).startswith("file:")
+if not DB_IS_URI:
+    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
 
 
 def get_conn() -> sqlite3.Connection:
-    conn = sqlite3.connect(str(DB_PATH))
+    conn = sqlite3.connect(str(DB_PATH), uri=DB_IS_URI)
     conn.row_factory = sqlite3.Row
     return conn
 
@@ -159,6 +164,12 @@ def init_db() -> None:
                 conn.execute("ALTER TABLE users ADD COLUMN plan_id TEXT DEFAULT 'free'")
         except Exception:
             pass
+        # Ensure users has refresh_ver (refresh tokens carry it as "ver")
+        try:
+            if column_missing('users', 'refresh_ver'):
+                conn.execute("ALTER TABLE users ADD COLUMN refresh_ver INTEGER NOT NULL DEFAULT 0")
+        except Exception:
+            pass
         # Ensure jobs_index has input_json for regenerate/duplicate
         try:
             if column_missing('jobs_index', 'input_json'):
@@ -216,22 +227,6 @@ def init_db() -> None:
         except Exception:
             pass
         conn.commit()
-        # Refresh tokens table for rotation (safe migration)
-        try:
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS refresh_tokens (
-                    user_id TEXT,
-                    token_id TEXT PRIMARY KEY,
-                    issued_at TEXT,
-                    revoked_at TEXT NULL
-                )
-                """
-            )
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_refresh_user ON refresh_tokens(user_id)")
-            conn.commit()
-        except Exception:
-            pass
         # Seed plans: free, pro
         try:
             now = _utcnow_iso()
@@ -574,6 +569,22 @@ def get_job_row(job_id: str) -> dict | None:
         conn.close()
 
 
+def get_job_rows(job_ids: List[str]) -> Dict[str, dict]:
+    """Fetch several job_queue rows in one query, keyed by job id; unknown ids are omitted."""
+    if not job_ids:
+        return {}
+    conn = get_conn()
+    try:
+        placeholders = ",".join("?" for _ in job_ids)
+        rows = conn.execute(
+            f"SELECT * FROM job_queue WHERE id IN ({placeholders})",
+            tuple(job_ids),
+        ).fetchall()
+        return {row["id"]: dict(row) for row in rows}
+    finally:
+        conn.close()
+
+
 def _shares_pk_col(conn: sqlite3.Connection) -> str:
     cols = [row[1] for row in conn.execute("PRAGMA table_info(shares)").fetchall()]
     return "share_id" if "share_id" in cols else "id"
@@ -613,52 +624,24 @@ def get_share(share_id: str) -> dict | None:
 # Refresh token helpers
 # =============================
 
-def store_refresh(user_id: str, token_id: str, issued_at_iso: str) -> None:
-    conn = get_conn()
-    try:
-        conn.execute(
-            "INSERT OR REPLACE INTO refresh_tokens(user_id, token_id, issued_at, revoked_at) VALUES(?, ?, ?, NULL)",
-            (user_id, token_id, issued_at_iso),
-        )
-        conn.commit()
-    finally:
-        conn.close()
-
-
-def revoke_refresh(token_id: str, revoked_at_iso: str) -> None:
+def get_refresh_version(user_id: str) -> Optional[int]:
+    """Current refresh-token version for user_id, or None if the user does not exist."""
     conn = get_conn()
     try:
-        conn.execute(
-            "UPDATE refresh_tokens SET revoked_at=? WHERE token_id=?",
-            (revoked_at_iso, token_id),
-        )
-        conn.commit()
+        row = conn.execute("SELECT refresh_ver FROM users WHERE id=?", (user_id,)).fetchone()
+        return int(row[0] or 0) if row else None
     finally:
         conn.close()
 
 
-def is_refresh_active(token_id: str) -> bool:
+def bump_refresh_version(user_id: str) -> int:
+    """Invalidate every outstanding refresh token of user_id; returns the new version."""
     conn = get_conn()
     try:
-        row = conn.execute(
-            "SELECT revoked_at FROM refresh_tokens WHERE token_id=?",
-            (token_id,),
-        ).fetchone()
-        if not row:
-            return False
-        return row[0] is None
-    finally:
-        conn.close()
-
-
-def revoke_all_for_user(user_id: str) -> None:
-    conn = get_conn()
-    try:
-        conn.execute(
-            "UPDATE refresh_tokens SET revoked_at=strftime('%Y-%m-%dT%H:%M:%SZ','now') WHERE user_id=? AND revoked_at IS NULL",
-            (user_id,),
-        )
+        conn.execute("UPDATE users SET refresh_ver = COALESCE(refresh_ver, 0) + 1 WHERE id=?", (user_id,))
         conn.commit()
+        row = conn.execute("SELECT refresh_ver FROM users WHERE id=?", (user_id,)).fetchone()
+        return int(row[0]) if row else 0
     finally:
         conn.close()
 
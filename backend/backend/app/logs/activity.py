@@ -87,22 +87,43 @@ def log_event(
         message: Human-readable message
         meta: Optional metadata dict
     """
+    log_events_batch(job_id, [(event_type, message, meta)])
+
+
+def log_events_batch(
+    job_id: str,
+    events: list[tuple[str, str, dict[str, Any] | None]]
+) -> None:
+    """
+    Log several activity events for a job with a single append.
+    
+    Opens the log file once and writes every line in one call instead of
+    paying an open/write/close per event.
+    
+    Args:
+        job_id: Job identifier
+        events: (event_type, message, meta) tuples, oldest first
+    """
     # Ensure log directory exists
     ACTIVITY_LOG_DIR.mkdir(exist_ok=True)
     
-    # Create log entry
-    entry = {
-        "ts_iso": datetime.utcnow().isoformat() + "Z",
-        "job_id": job_id,
-        "event_type": event_type,
-        "message": message,
-        "meta": meta or {}
-    }
+    # Create log entries
+    ts_iso = datetime.utcnow().isoformat() + "Z"
+    lines = [
+        json.dumps({
+            "ts_iso": ts_iso,
+            "job_id": job_id,
+            "event_type": event_type,
+            "message": message,
+            "meta": meta or {}
+        }) + "\n"
+        for event_type, message, meta in events
+    ]
     
     # Append to JSONL file
     try:
         with open(ACTIVITY_LOG_FILE, "a", encoding="utf-8") as f:
-            f.write(json.dumps(entry) + "\n")
+            f.write("".join(lines))
     except Exception as e:
         # Don't fail job on logging error
         print(f"Failed to log activity event: {e}")
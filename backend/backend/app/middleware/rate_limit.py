@@ -1,7 +1,169 @@
-class RateLimitMiddleware:
-    def __init__(self, app, **_):
-        self.app = app
+from __future__ import annotations
 
-    async def __call__(self, scope, receive, send):
-        # Placeholder: no rate limiting enforced in this stub.
-        await self.app(scope, receive, send)
+import math
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
+
+from fastapi import Request
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.responses import JSONResponse
+
+from ..auth.security import JWT_SECRET, decode
+
+
+# RL_ALGORITHM selects how hits are tracked per key:
+#   fixed         (window_start, count)       - O(1) per key, bursts at window edges
+#   sliding       deque of hit timestamps     - O(limit) per key, exact rolling window
+#   token_bucket  (tokens, last_refill)       - O(1) per key, refills limit/window per second
+ALGORITHMS = ("fixed", "sliding", "token_bucket")
+DEFAULT_ALGORITHM = "token_bucket"
+
+
+def clock() -> float:
+    """Current epoch seconds. Limiters look this up per hit, so tests can monkeypatch it."""
+    return time.time()
+
+
+class RateDecision(NamedTuple):
+    allowed: bool
+    limit: int
+    remaining: int
+    reset_at: float  # epoch seconds when the next hit would be allowed / window resets
+
+
+class RateLimiter:
+    def __init__(self, algorithm: str = DEFAULT_ALGORITHM, clock: Optional[Callable[[], float]] = None):
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Unknown RL_ALGORITHM {algorithm!r}; expected one of {ALGORITHMS}")
+        self.algorithm = algorithm
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, Any] = {}
+
+    def hit(self, key: str, limit: int, window_sec: float) -> RateDecision:
+        """Record one request for key and report whether it is within limit per window_sec."""
+        now = self._clock() if self._clock is not None else clock()
+        with self._lock:
+            if self.algorithm == "fixed":
+                return self._hit_fixed(key, limit, window_sec, now)
+            if self.algorithm == "sliding":
+                return self._hit_sliding(key, limit, window_sec, now)
+            return self._hit_token_bucket(key, limit, window_sec, now)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+    def _hit_fixed(self, key: str, limit: int, window_sec: float, now: float) -> RateDecision:
+        start, count = self._buckets.get(key, (now, 0))
+        if now >= start + window_sec:
+            start, count = now, 0
+        allowed = count < limit
+        if allowed:
+            count += 1
+        self._buckets[key] = (start, count)
+        return RateDecision(allowed, limit, limit - count, start + window_sec)
+
+    def _hit_sliding(self, key: str, limit: int, window_sec: float, now: float) -> RateDecision:
+        hits = self._buckets.setdefault(key, deque())
+        while hits and hits[0] <= now - window_sec:
+            hits.popleft()
+        allowed = len(hits) < limit
+        if allowed:
+            hits.append(now)
+        reset_at = hits[0] + window_sec if hits else now + window_sec
+        return RateDecision(allowed, limit, limit - len(hits), reset_at)
+
+    def _hit_token_bucket(self, key: str, limit: int, window_sec: float, now: float) -> RateDecision:
+        rate = limit / window_sec
+        tokens, last = self._buckets.get(key, (float(limit), now))
+        tokens = min(float(limit), tokens + (now - last) * rate)
+        allowed = tokens >= 1.0
+        if allowed:
+            tokens -= 1.0
+        self._buckets[key] = (tokens, now)
+        # Allowed: when the bucket is full again; denied: when the next token lands
+        wait = (limit - tokens) / rate if allowed else (1.0 - tokens) / rate
+        return RateDecision(allowed, limit, math.floor(tokens), now + wait)
+
+
+@lru_cache(maxsize=1)
+def get_limiter() -> RateLimiter:
+    return RateLimiter(os.getenv("RL_ALGORITHM", DEFAULT_ALGORITHM))
+
+
+# (method, path) -> (metric, scope, limit env var, default limit), for routes
+# mounted in backend.backend.main. Limits and RL_WINDOW_SEC are read per
+# request, so they can be retuned without a restart.
+RULES: Dict[Tuple[str, str], Tuple[str, str, str, int]] = {
+    ("POST", "/render"): ("render", "user", "RL_RENDER_PER_USER", 30),
+    ("POST", "/render/simple"): ("render", "user", "RL_RENDER_PER_USER", 30),
+    ("POST", "/shares"): ("share", "user", "RL_SHARE_PER_USER", 50),
+}
+DEFAULT_WINDOW_SEC = 60
+
+
+def _client_ip(request: Request) -> str:
+    peer = request.client.host if request.client else ""
+    # X-Forwarded-For is client-controlled; only believe it when the peer is
+    # one of our proxies (RL_TRUSTED_PROXIES, comma-separated addresses)
+    trusted = {p.strip() for p in os.getenv("RL_TRUSTED_PROXIES", "").split(",") if p.strip()}
+    if peer not in trusted:
+        return peer
+    hops = [h.strip() for h in request.headers.get("x-forwarded-for", "").split(",") if h.strip()]
+    # Walk back from the nearest hop: the first address our proxies did not
+    # add is the client; anything left of it may be forged
+    for hop in reversed(hops):
+        if hop not in trusted:
+            return hop
+    return peer
+
+
+def _user_id(request: Request) -> Optional[str]:
+    auth = request.headers.get("authorization", "")
+    if not auth.lower().startswith("bearer "):
+        return None
+    try:
+        # Verified, so a forged sub can't be used to get a fresh allowance
+        return decode(auth[7:].strip(), JWT_SECRET).get("sub")
+    except Exception:
+        return None
+
+
+class RateLimitMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint):
+        rule = RULES.get((request.method, request.url.path.rstrip("/") or "/"))
+        if rule is None or os.getenv("RATE_LIMIT_DISABLED", "0") in ("1", "true", "True"):
+            return await call_next(request)
+
+        metric, scope, limit_env, default_limit = rule
+        limit = int(os.getenv(limit_env, str(default_limit)))
+        window_sec = float(os.getenv("RL_WINDOW_SEC", str(DEFAULT_WINDOW_SEC)))
+        # Per-user rules fall back to the client IP for anonymous requests
+        who = (_user_id(request) if scope == "user" else None) or f"ip:{_client_ip(request)}"
+        decision = get_limiter().hit(f"{metric}:{who}", limit, window_sec)
+        if decision.allowed:
+            return await call_next(request)
+
+        reset_at = datetime.fromtimestamp(decision.reset_at, timezone.utc)
+        retry_after = max(1, math.ceil(decision.reset_at - clock()))
+        return JSONResponse(
+            status_code=429,
+            headers={"Retry-After": str(retry_after)},
+            content={
+                "error": {
+                    "code": "QUOTA_EXCEEDED",
+                    "metric": metric,
+                    "scope": scope,
+                    "limit": limit,
+                    # Requests in the window, counting this refused one
+                    "used": limit - decision.remaining + 1,
+                    "reset_at": reset_at.isoformat(),
+                }
+            },
+        )
@@ -3,6 +3,7 @@ Motion Template Engine - JSON-driven FFmpeg filter generation
 For hybrid video pipeline - gracefully handles SIMULATE_RENDER mode
 """
 import os
+from functools import lru_cache
 from typing import TypedDict, List, Dict, Any, Optional
 
 
@@ -196,6 +197,12 @@ def compile_to_ffmpeg_filter(
     return ",".join(filters)
 
 
+@lru_cache(maxsize=None)
+def _compile_template(template_name: str, width: int, height: int, simulate: bool) -> str:
+    """Compiled filter for a built-in template (TEMPLATES is static, so memoize)"""
+    return compile_to_ffmpeg_filter(TEMPLATES[template_name]["steps"], width, height, simulate)
+
+
 def apply_template(
     template_name: str,
     input_path: str,
@@ -221,24 +228,24 @@ def apply_template(
     if template_name not in TEMPLATES:
         return None
     
-    template = TEMPLATES[template_name]
-    steps = template["steps"]
+    simulate = int(os.getenv("SIMULATE_RENDER", "0")) == 1
     
     # Perform text replacements in steps
     if replacements:
         import copy
-        steps = copy.deepcopy(steps)
+        steps = copy.deepcopy(TEMPLATES[template_name]["steps"])
         for step in steps:
             if "text" in step.get("params", {}):
                 text = step["params"]["text"]
                 for placeholder, value in replacements.items():
                     text = text.replace(f"{{{placeholder}}}", value)
                 step["params"]["text"] = text
-    
-    filter_str = compile_to_ffmpeg_filter(steps, width, height)
+        filter_str = compile_to_ffmpeg_filter(steps, width, height, simulate)
+    else:
+        filter_str = _compile_template(template_name, width, height, simulate)
     
     # In SIMULATE mode, don't actually run FFmpeg
-    if int(os.getenv("SIMULATE_RENDER", "0")) == 1:
+    if simulate:
         return filter_str
     
     # Future: run FFmpeg command with filter_complex
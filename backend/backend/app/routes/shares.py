@@ -70,6 +70,16 @@ OG_TEMPLATE = '''
 </html>
 '''
 
+# Page shell for /s/{id}; only the per-share fragments are substituted per request
+SHARE_PAGE_TEMPLATE = (
+    "<!DOCTYPE html><html lang='en'><head>{meta_tags}</head>"
+    "<body style='margin:0;padding:0;font-family:sans-serif;background:#fafafa;'>"
+    "<div style='max-width:480px;margin:40px auto;padding:24px;background:#fff;border-radius:8px;box-shadow:0 2px 8px #0001;'>"
+    "<h2 style='margin-top:0'>{title}</h2><p>{description}</p>{player}"
+    "<div style='margin-top:16px;font-size:12px;color:#888;'>Shared via BhaktiGen</div>"
+    "</div></body></html>"
+)
+
 @router.post("/shares", response_model=dict)
 def create_share(share: ShareCreate, db: DB = Depends(get_db), user: User = Depends(get_current_user)):
     if not re.match(r"^https?://", share.artifact_url):
@@ -106,7 +116,7 @@ def get_share_page(id: str, request: Request, db: DB = Depends(get_db)):
         player = f'<img src="{artifact_url}" style="max-width:100%;border-radius:6px" />'
     else:
         player = f'<a href="{artifact_url}" target="_blank">Open Artifact</a>'
-    html = f"<!DOCTYPE html><html lang='en'><head>{meta_tags}</head><body style='margin:0;padding:0;font-family:sans-serif;background:#fafafa;'><div style='max-width:480px;margin:40px auto;padding:24px;background:#fff;border-radius:8px;box-shadow:0 2px 8px #0001;'><h2 style='margin-top:0'>{title}</h2><p>{description}</p>{player}<div style='margin-top:16px;font-size:12px;color:#888;'>Shared via BhaktiGen</div></div></body></html>"
+    html = SHARE_PAGE_TEMPLATE.format(meta_tags=meta_tags, title=title, description=description, player=player)
     return HTMLResponse(content=html)
 
 @router.get("/oembed")
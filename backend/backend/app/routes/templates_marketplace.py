@@ -2,7 +2,7 @@ from __future__ import annotations
 from fastapi import APIRouter, HTTPException, Depends
 from typing import Optional
 from app.db import get_conn
-from app.settings import FEATURE_TEMPLATES_MARKETPLACE
+from app import settings
 from app.auth.security import get_current_user
 import uuid
 import json
@@ -17,7 +17,8 @@ router = APIRouter(prefix="/marketplace", tags=["marketplace"])
 
 
 def require_marketplace_enabled():
-    if not FEATURE_TEMPLATES_MARKETPLACE:
+    # Read through the module so the flag can be flipped at runtime (tests)
+    if not settings.FEATURE_TEMPLATES_MARKETPLACE:
         raise HTTPException(status_code=404, detail="Not found")
 
 
@@ -5,22 +5,21 @@ from typing import Any, Dict, Iterable, Set, Tuple
 VAR_PATTERN = re.compile(r"\{\{\s*([a-zA-Z_][a-zA-Z0-9_]*)\s*\}\}")
 
 
-def _iter_strings(obj: Any) -> Iterable[Tuple[list, str]]:
-    """Yield (path, string) for all string values within nested dict/list structure.
+def _iter_strings(obj: Any) -> Iterable[str]:
+    """Yield every string value within a nested dict/list structure.
 
-    Path is a list of keys/indices to reach the string value.
+    Walks with an explicit stack rather than recursive generators, so deep
+    plans don't pay a generator frame per level for each string.
     """
-    if isinstance(obj, str):
-        yield ([], obj)
-        return
-    if isinstance(obj, dict):
-        for k, v in obj.items():
-            for sub_path, s in _iter_strings(v):
-                yield ([k, *sub_path], s)
-    elif isinstance(obj, list):
-        for i, v in enumerate(obj):
-            for sub_path, s in _iter_strings(v):
-                yield ([i, *sub_path], s)
+    stack = [obj]
+    while stack:
+        cur = stack.pop()
+        if isinstance(cur, str):
+            yield cur
+        elif isinstance(cur, dict):
+            stack.extend(cur.values())
+        elif isinstance(cur, list):
+            stack.extend(cur)
 
 
 def parse_vars(plan: Dict[str, Any]) -> Set[str]:
@@ -29,10 +28,9 @@ def parse_vars(plan: Dict[str, Any]) -> Set[str]:
     Returns a set of variable names without braces.
     """
     vars_found: Set[str] = set()
-    plan = plan or {}
-    for _path, text in _iter_strings(plan):
-        for m in VAR_PATTERN.finditer(text):
-            vars_found.add(m.group(1))
+    for text in _iter_strings(plan or {}):
+        if "{{" in text:
+            vars_found.update(VAR_PATTERN.findall(text))
     return vars_found
 
 
@@ -60,7 +58,7 @@ def apply_vars(plan: Dict[str, Any], inputs: Dict[str, Any] | None) -> Tuple[Dic
 
     def walk(obj: Any) -> Any:
         if isinstance(obj, str):
-            return replace_text(obj)
+            return replace_text(obj) if "{{" in obj else obj
         if isinstance(obj, dict):
             return {k: walk(v) for k, v in obj.items()}
         if isinstance(obj, list):
@@ -7,6 +7,7 @@ sys.path.insert(0, str(REPO / "backend"))
 
 from fastapi import FastAPI
 from backend.backend.app.db import init_db
+from backend.backend.app.middleware.rate_limit import RateLimitMiddleware
 from backend.backend.routes.shares import router as shares_router
 from backend.routes.preflight import router as preflight_router
 from backend.routes.render import router as render_router
@@ -14,6 +15,7 @@ from backend.routes.storyboard import router as storyboard_router
 from backend.routes.stubs import router as stubs_router
 
 app = FastAPI(title="BhaktiGen Backend")
+app.add_middleware(RateLimitMiddleware)
 
 @app.on_event("startup")
 def _startup():
@@ -0,0 +1,3 @@
+"""
+Backend API routes package
+"""
@@ -30,6 +30,13 @@ class ExportYouTubeRes(BaseModel):
     youtube_url: Optional[str]
 
 
+# Resolve the postponed annotations now, while this module's namespace is at
+# hand: loaders that exec this file by path (outside sys.modules) would
+# otherwise leave the models to be rebuilt lazily on first validation
+ExportYouTubeReq.model_rebuild()
+ExportYouTubeRes.model_rebuild()
+
+
 @router.post("/youtube", response_model=ExportYouTubeRes)
 def export_youtube(req: ExportYouTubeReq, user=Depends(get_current_user)):
     if not user:
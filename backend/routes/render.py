@@ -1,5 +1,6 @@
 """
-Render router: POST /render to enqueue, GET /render/{job_id}/status to poll.
+Render router: POST /render to enqueue, GET /render/{job_id}/status to poll
+(GET /render/status?ids=... for several jobs at once).
 Production-ready with simulator mode, robust error handling, and in-memory job tracking.
 """
 import os
@@ -25,7 +26,7 @@ except Exception:
     def get_current_user():  # type: ignore
         return None
 from backend.backend.app.usage.service import check_quota_or_raise, inc_renders
-from backend.backend.app.db import get_conn, enqueue_job, get_job_row, mark_cancelled
+from backend.backend.app.db import get_conn, enqueue_job, get_job_row, get_job_rows, mark_cancelled
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/render", tags=["render"])
@@ -426,7 +427,8 @@ def _upload_artifacts(job_id: str) -> None:
     """Best-effort upload of known artifacts to storage.
 
     Normalizes final video to key '{job_id}/final.mp4'.
-    Skips missing files; logs warnings but does not raise.
+    Skips missing files; uploads the rest in one put_files batch and logs a
+    warning (does not raise) for each artifact that fails.
     """
     storage = get_storage()
     job_dir = OUTPUT_ROOT / job_id
@@ -438,42 +440,34 @@ def _upload_artifacts(job_id: str) -> None:
         job_dir / "output.mp4",
     ]
     final_src = next((p for p in final_candidates if p.exists()), None)
+
+    # (key, source, activity message) for every artifact present on disk
+    artifacts = []
     if final_src:
+        artifacts.append((f"{job_id}/final.mp4", final_src, "Uploaded final video"))
+    for name in ("tts.wav", "thumb.png"):
+        src = job_dir / name
+        if src.exists():
+            artifacts.append((f"{job_id}/{name}", src, f"Uploaded {name}"))
+    if not artifacts:
+        return
+
+    try:
+        results = storage.put_files([(key, str(src)) for key, src, _ in artifacts])
+    except Exception as e:  # noqa: BLE001
+        logger.warning(f"Artifact upload failed for {job_id}: {e}")
+        return
+
+    for key, src, message in artifacts:
+        error = results.get(key)
+        if error is not None:
+            logger.warning(f"Artifact upload failed for {key}: {error}")
+            continue
         try:
-            storage.put_file(f"{job_id}/final.mp4", str(final_src))
-            try:
-                size = final_src.stat().st_size
-            except Exception:
-                size = None
-            log_event(job_id, "artifact_uploaded", "Uploaded final video", {"key": f"{job_id}/final.mp4", "size_bytes": size})
-        except Exception as e:  # noqa: BLE001
-            logger.warning(f"Upload final.mp4 failed for {job_id}: {e}")
-
-    # TTS audio
-    tts_src = job_dir / "tts.wav"
-    if tts_src.exists():
-        try:
-            storage.put_file(f"{job_id}/tts.wav", str(tts_src))
-            try:
-                size = tts_src.stat().st_size
-            except Exception:
-                size = None
-            log_event(job_id, "artifact_uploaded", "Uploaded tts.wav", {"key": f"{job_id}/tts.wav", "size_bytes": size})
-        except Exception as e:  # noqa: BLE001
-            logger.warning(f"Upload tts.wav failed for {job_id}: {e}")
-
-    # Thumbnail image
-    thumb_src = job_dir / "thumb.png"
-    if thumb_src.exists():
-        try:
-            storage.put_file(f"{job_id}/thumb.png", str(thumb_src))
-            try:
-                size = thumb_src.stat().st_size
-            except Exception:
-                size = None
-            log_event(job_id, "artifact_uploaded", "Uploaded thumb.png", {"key": f"{job_id}/thumb.png", "size_bytes": size})
-        except Exception as e:  # noqa: BLE001
-            logger.warning(f"Upload thumb.png failed for {job_id}: {e}")
+            size = src.stat().st_size
+        except Exception:
+            size = None
+        log_event(job_id, "artifact_uploaded", message, {"key": key, "size_bytes": size})
 
 
 # ============================================================================== 
@@ -686,6 +680,86 @@ def post_simple_render(req: SimpleRenderRequest, request: Request, user=Depends(
         raise
 
 
+def _resolve_job_status(job_id: str, qrow: Optional[dict], user) -> Dict[str, Any]:
+    """Check access to job_id and build its status from the queue row (if any) or the job summary."""
+    if not user:
+        if not (qrow and (qrow.get("user_id") == "")):
+            raise HTTPException(status_code=401, detail="Unauthorized")
+    else:
+        owner_id = _get_job_owner(job_id)
+        if owner_id and owner_id != user["id"]:
+            raise HTTPException(status_code=403, detail="Forbidden")
+
+    # First, check durable queue status
+    if qrow:
+        qstatus = qrow["status"]
+        if qstatus in ("queued", "running"):
+            raw = {"state": qstatus, "progress_pct": None}
+            return _format_job_status(raw)
+        if qstatus == "failed":
+            err = {"code": qrow.get("err_code") or "UNKNOWN", "message": qrow.get("err_message") or "Render failed", "phase": "finalize"}
+            return _format_job_status({"state": "error", "error": err})
+        if qstatus in ("cancelled", "canceled"):
+            return _format_job_status({"state": "cancelled"})
+
+    # If completed or if no queue row, fall back to job summary/artifacts
+    status = get_status(job_id)
+
+    if not status:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Job {job_id} not found"
+        )
+
+    return _format_job_status(status)
+
+
+def _status_error(job_id: str, code: str, message: str) -> Dict[str, Any]:
+    return {
+        "status": "failed",
+        "error": {
+            "code": code,
+            "phase": "finalize",
+            "message": message,
+            "meta": {"job_id": job_id},
+        },
+    }
+
+
+MAX_BATCH_STATUS_IDS = 100
+_HTTP_ERROR_CODES = {401: "UNAUTHORIZED", 403: "FORBIDDEN", 404: "NOT_FOUND"}
+
+
+@router.get("/status")
+def get_render_statuses(ids: str = Query(..., description="Comma-separated job ids"), user=Depends(get_current_user)):
+    """
+    GET /render/status?ids=j1,j2: Poll several jobs in one call
+
+    Reads all queue rows with a single query instead of one request per job.
+    Each job maps to the same body GET /render/{job_id}/status would return,
+    or to an error envelope when that call would have failed.
+
+    Returns:
+        - 200: {job_id: status}
+        - 400: No ids, or more than MAX_BATCH_STATUS_IDS
+    """
+    job_ids = list(dict.fromkeys(j.strip() for j in ids.split(",") if j.strip()))
+    if not job_ids or len(job_ids) > MAX_BATCH_STATUS_IDS:
+        raise HTTPException(status_code=400, detail=f"Pass between 1 and {MAX_BATCH_STATUS_IDS} job ids")
+
+    qrows = get_job_rows(job_ids)
+    statuses: Dict[str, Any] = {}
+    for job_id in job_ids:
+        try:
+            statuses[job_id] = _resolve_job_status(job_id, qrows.get(job_id), user)
+        except HTTPException as exc:
+            statuses[job_id] = _status_error(job_id, _HTTP_ERROR_CODES.get(exc.status_code, "UNKNOWN"), str(exc.detail))
+        except Exception as exc:  # noqa: BLE001 - one bad job must not fail the batch
+            logger.exception(f"Error getting status for {job_id}: {exc}")
+            statuses[job_id] = _status_error(job_id, "UNKNOWN", "Unable to fetch job status")
+    return statuses
+
+
 @router.get("/{job_id}/status")
 def get_render_status(job_id: str, user=Depends(get_current_user)):
     """
@@ -698,52 +772,14 @@ def get_render_status(job_id: str, user=Depends(get_current_user)):
         - 404: Job not found
     """
     try:
-        qrow = get_job_row(job_id)
-        if not user:
-            if not (qrow and (qrow.get("user_id") == "")):
-                raise HTTPException(status_code=401, detail="Unauthorized")
-        else:
-            owner_id = _get_job_owner(job_id)
-            if owner_id and owner_id != user["id"]:
-                raise HTTPException(status_code=403, detail="Forbidden")
-
-        # First, check durable queue status
-        if qrow:
-            qstatus = qrow["status"]
-            if qstatus in ("queued", "running"):
-                raw = {"state": qstatus, "progress_pct": None}
-                return _format_job_status(raw)
-            if qstatus == "failed":
-                err = {"code": qrow.get("err_code") or "UNKNOWN", "message": qrow.get("err_message") or "Render failed", "phase": "finalize"}
-                return _format_job_status({"state": "error", "error": err})
-            if qstatus in ("cancelled", "canceled"):
-                return _format_job_status({"state": "cancelled"})
-
-        # If completed or if no queue row, fall back to job summary/artifacts
-        status = get_status(job_id)
-
-        if not status:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Job {job_id} not found"
-            )
-
-        return _format_job_status(status)
+        return _resolve_job_status(job_id, get_job_row(job_id), user)
 
     except HTTPException:
         raise
 
     except Exception as exc:  # noqa: BLE001 - return structured error envelope
         logger.exception(f"Error getting status for {job_id}: {exc}")
-        return {
-            "status": "failed",
-            "error": {
-                "code": "UNKNOWN",
-                "phase": "finalize",
-                "message": "Unable to fetch job status",
-                "meta": {"job_id": job_id},
-            },
-        }
+        return _status_error(job_id, "UNKNOWN", "Unable to fetch job status")
 
 
 @router.get("/{job_id}/activity")
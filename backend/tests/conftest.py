@@ -1,15 +1,181 @@
 import pytest
-from fastapi.testclient import TestClient
 
+import importlib
+import os
+import sqlite3
 import sys
 from pathlib import Path
+from types import ModuleType
 
-REPO = Path(__file__).resolve().parents[2]
-sys.path.insert(0, str(REPO / "backend" / "backend"))  # enables: import app.*
-sys.path.insert(0, str(REPO / "backend"))             # enables: import backend.*
+# Tests run against a shared-cache in-memory SQLite database instead of the
+# on-disk app.db: no fsync per commit, and every xdist worker (a separate
+# process) automatically gets its own copy. Must be set before app.db is
+# imported, since it resolves DB_PATH at import time.
+TEST_DB_URI = "file:testdb?mode=memory&cache=shared"
+os.environ.setdefault("APP_DB_PATH", TEST_DB_URI)
+
+# An in-memory database is dropped when its last connection closes, and
+# get_conn() callers close theirs after every query; hold one open for the
+# whole session so the schema and seeded rows persist between calls.
+# check_same_thread=False: TestClient serves requests from a worker thread
+_db_keepalive = sqlite3.connect(os.environ["APP_DB_PATH"], uri=True, check_same_thread=False)
+_db_keepalive.row_factory = sqlite3.Row
+
+# The app itself is imported lazily, in app_instance: pure unit modules
+# (storage, template vars, ...) never pay for assembling FastAPI
+from app.db import init_db
+
+# Optional SDKs that the app imports at module level but tests only reach
+# through monkeypatched clients. boto3 needs no entry: app.artifacts_storage.s3
+# imports it lazily, when an S3Storage is actually constructed.
+_IMPORT_STUBS = ("stripe",)
+
+
+def pytest_configure(config):
+    # Install the stubs once per session, before any test module imports routes
+    for name in _IMPORT_STUBS:
+        sys.modules.setdefault(name, ModuleType(name))
+
+
+# The same security module is importable as app.* and backend.backend.app.*;
+# both copies hash through their own PBKDF2_ITERATIONS
+_SECURITY_MODULES = ("app.auth.security", "backend.backend.app.auth.security")
+
+
+@pytest.fixture(scope="session")
+def fast_password_hashing():
+    """Lower the PBKDF2 work factor for the session; production hashing cost
+    buys nothing in tests and dominates every register/login."""
+    with pytest.MonkeyPatch.context() as mp:
+        for name in _SECURITY_MODULES:
+            mp.setattr(importlib.import_module(name), "PBKDF2_ITERATIONS", 1_000)
+        yield
+
+
+# Durability trade-offs for connections to the test database only: seeds that
+# commit row by row shouldn't pay an fsync each time (matters when
+# APP_DB_PATH points at a file; the shared in-memory default ignores WAL)
+_TEST_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=OFF",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def fast_sqlite():
+    # get_conn() is imported by name all over the app, so wrap the connect call
+    # it makes rather than the function itself
+    real_connect = sqlite3.connect
+
+    def _connect(database, *args, **kwargs):
+        conn = real_connect(database, *args, **kwargs)
+        if str(database) == os.environ["APP_DB_PATH"]:
+            for pragma in _TEST_PRAGMAS:
+                conn.execute(pragma)
+        return conn
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(sqlite3, "connect", _connect)
+        yield
+
+
+@pytest.fixture(scope="session")
+def app_instance(fast_password_hashing):
+    from backend.backend.main import app  # use inner app
+    return app
 
-from backend.backend.main import app  # use inner app
 
 @pytest.fixture(scope="session")
-def client():
-    return TestClient(app)
+def _session_client(app_instance):
+    # One app, one lifespan: startup (init_db) runs once per worker session and
+    # every test shares the same router table and client
+    from fastapi.testclient import TestClient
+
+    with TestClient(app_instance) as c:
+        yield c
+
+
+@pytest.fixture
+def client(_session_client):
+    # Tests used to get a fresh client per module; keep auth/CSRF cookies from
+    # leaking between tests now that the transport is shared
+    _session_client.cookies.clear()
+    return _session_client
+
+
+# Base tables init_db() only migrates (it adds plan_id, refresh_ver, input_json,
+# ... with ALTER TABLE) but never creates; tests seed them directly
+_BASE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    id TEXT PRIMARY KEY,
+    email TEXT UNIQUE NOT NULL,
+    password_hash TEXT NOT NULL,
+    created_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS projects (
+    id TEXT PRIMARY KEY,
+    user_id TEXT NOT NULL,
+    title TEXT NOT NULL,
+    description TEXT NULL,
+    cover_thumb TEXT NULL,
+    created_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS jobs_index (
+    id TEXT PRIMARY KEY,
+    project_id TEXT NULL,
+    title TEXT NULL,
+    created_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS usage_daily (
+    user_id TEXT NOT NULL,
+    day TEXT NOT NULL,
+    renders INTEGER NOT NULL DEFAULT 0,
+    tts_sec INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (user_id, day)
+);
+"""
+
+
+@pytest.fixture(scope="session")
+def db():
+    """Create the SQLite schema once and hand out the session's connection.
+
+    Tests seed and assert through this connection instead of opening (and
+    closing) a fresh one via get_conn() for every statement.
+    """
+    _db_keepalive.executescript(_BASE_SCHEMA)
+    init_db()
+    return _db_keepalive
+
+
+# One user per plan, for tests that gate features on plan_id
+_PLAN_USERS = [
+    ("u_free", "free@example.com", "x", "", "free"),
+    ("u_pro", "pro@example.com", "x", "", "pro"),
+]
+
+
+@pytest.fixture(scope="session")
+def plan_users(db):
+    # Inserted once per session; tests only add the job rows they own
+    with db:
+        db.executemany("INSERT OR REPLACE INTO users (id, email, password_hash, created_at, plan_id) VALUES (?,?,?,?,?)",
+                       _PLAN_USERS)
+
+
+def virtualize_artifacts(monkeypatch, job_dir: Path, names) -> None:
+    """Make ``job_dir / name`` report as present without touching the disk.
+
+    For tests that only care whether an artifact exists (gates, upload keys),
+    patching Path.exists for those paths replaces mkdir + write_bytes. Tests
+    that read the file contents must still write real bytes.
+    """
+    virtual = {job_dir / name for name in names}
+    real_exists = Path.exists
+
+    def _exists(self, *args, **kwargs):
+        return self in virtual or real_exists(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "exists", _exists)
@@ -23,12 +23,17 @@ Usage:
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import time
 import os
 import json
+import re
+import shutil
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from PIL import Image
-from pydub import AudioSegment
 
 # Configuration
 BACKEND = os.getenv('BACKEND_URL', 'http://localhost:8000')
@@ -41,14 +46,32 @@ JOB_STATUS_URL = f"{BACKEND}/api/v1/jobs/{{job_id}}"
 PREVIEW_IMAGE_URL = f"{BACKEND}/api/v1/projects/{{project_id}}/preview/image/{{scene_number}}"
 PREVIEW_AUDIO_URL = f"{BACKEND}/api/v1/projects/{{project_id}}/preview/audio/{{scene_number}}"
 
+# One pooled session for every call, so the smoke run reuses keep-alive
+# connections instead of opening a new socket per request
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+SESSION.mount('http://', _adapter)
+SESSION.mount('https://', _adapter)
+SESSION.headers.update({'User-Agent': 'devotionalai-smoke'})
+
+# Upper bound for the thread pools below, matching the session's pool_maxsize
+MAX_WORKERS = 8
+
 # Local storage path (should match config.LOCAL_STORAGE_PATH in backend)
 LOCAL_STORAGE_PATH = Path(os.getenv('LOCAL_STORAGE_PATH', './storage'))
 
+# Placeholder images/audio are identical from run to run, so each distinct one
+# is rendered once into this directory and then hard-linked into the project
+TEMPLATE_DIR = Path(os.getenv('SMOKE_TEMPLATE_DIR', LOCAL_STORAGE_PATH / '.smoke_templates'))
+
 # Test user credentials
 TEST_EMAIL = f"smoke_test_{int(time.time())}@example.com"
 TEST_PASSWORD = "Sm0keTestPass!"
 TEST_NAME = "Smoke Tester"
 
+# "Duration: 6-8s" style hints in scene notes
+DURATION_RE = re.compile(r"Duration:\s*(\d+)(?:[–-](\d+))?s")
+
 # Scenes to create
 SCENES = [
     {"scene_number": 1, "scene_title": "Intro: Divine Light", "voiceover": "यह आरम्भ है। प्रभु की द्रष्टि।", "notes": "Duration: 6-8s"},
@@ -59,7 +82,7 @@ SCENES = [
 
 def register_user():
     print('Registering test user...')
-    r = requests.post(REGISTER_URL, data={
+    r = SESSION.post(REGISTER_URL, data={
         'email': TEST_EMAIL,
         'password': TEST_PASSWORD,
         'name': TEST_NAME
@@ -72,7 +95,7 @@ def register_user():
 def create_project(token, name='Smoke Test Project'):
     print('Creating project...')
     headers = {'Authorization': f'Bearer {token}'}
-    r = requests.post(CREATE_PROJECT_URL, headers=headers, data={'name': name})
+    r = SESSION.post(CREATE_PROJECT_URL, headers=headers, data={'name': name})
     r.raise_for_status()
     return r.json()['project_id']
 
@@ -80,36 +103,101 @@ def create_project(token, name='Smoke Test Project'):
 def update_project_story(token, project_id, scenes):
     headers = {'Authorization': f'Bearer {token}'}
     payload = {'story_data': {'scenes': scenes}}
-    r = requests.put(UPDATE_PROJECT_URL.format(project_id=project_id), headers=headers, json=payload)
+    r = SESSION.put(UPDATE_PROJECT_URL.format(project_id=project_id), headers=headers, json=payload)
     r.raise_for_status()
     print('Updated project with mock scenes')
 
 
+PROJECT_SUBDIRS = ('images', 'audio', 'subtitles', 'videos', 'prompts')
+
+
 def ensure_local_project_dirs(user_id, project_id):
     base = LOCAL_STORAGE_PATH / str(user_id) / str(project_id)
-    for sub in ['images', 'audio', 'subtitles', 'videos', 'prompts']:
-        (base / sub).mkdir(parents=True, exist_ok=True)
+    # Walk/create the parent chain once; each subdir is then a single mkdir
+    base.mkdir(parents=True, exist_ok=True)
+    for sub in PROJECT_SUBDIRS:
+        (base / sub).mkdir(exist_ok=True)
     return base
 
 
-def create_placeholder_image(path: Path, scene_num: int):
-    # Create a simple 4K placeholder image with scene number
-    img = Image.new('RGB', (3840, 2160), color=(30, 20, 60))
-    d = Image.ImageDraw.Draw(img)
-    text = f"Scene {scene_num} - DevotionalAI Placeholder"
+# PIL is imported on first render rather than at module import, so collecting
+# or importing this module doesn't pay for it.
+_PALETTE = [30, 20, 60, 255, 220, 120, 0, 0, 0, 255, 255, 255]
+_BG, _TEXT = 0, 1
+
+
+@lru_cache(maxsize=None)
+def _base_image():
+    # Solid 4K background shared by every scene; each placeholder copies it instead
+    # of allocating and filling a fresh image. Background plus text only needs a
+    # few colours, so it's a palette image: 1 byte/pixel instead of 3 for RGB.
+    from PIL import Image
+    img = Image.new('P', (3840, 2160), _BG)
+    img.putpalette(_PALETTE)
+    return img
+
+
+@lru_cache(maxsize=None)
+def _font():
+    # Loaded once; truetype() searches the font dirs and parses the file each call
+    from PIL import ImageFont
     try:
-        from PIL import ImageFont
-        font = ImageFont.truetype('arial.ttf', 80)
+        return ImageFont.truetype('arial.ttf', 80)
     except Exception:
-        font = None
-    d.text((200, 1000), text, fill=(255, 220, 120), font=font)
-    img.save(path, format='PNG')
+        return ImageFont.load_default()
+
+
+def _materialize(template: Path, path: Path, render):
+    # Render the template on first use (to a temp name, so concurrent workers
+    # never link a half-written file), then link it into place. Falls back to
+    # a copy when the storage dir is on a different filesystem.
+    if not template.exists():
+        template.parent.mkdir(parents=True, exist_ok=True)
+        tmp = template.with_name(f'.{os.getpid()}-{threading.get_ident()}-{template.name}')
+        render(tmp)
+        os.replace(tmp, template)
+    try:
+        os.link(template, path)
+    except OSError:
+        shutil.copyfile(template, path)
+
+
+def create_placeholder_image(path: Path, scene_num: int):
+    _materialize(TEMPLATE_DIR / f'scene_{scene_num}.png', path,
+                 lambda p: _render_placeholder_image(p, scene_num))
 
 
 def create_placeholder_audio(path: Path, duration_seconds=6):
-    # Create a short silent mp3 using pydub
-    silence = AudioSegment.silent(duration=duration_seconds * 1000)
-    silence.export(path, format='mp3')
+    _materialize(TEMPLATE_DIR / f'silence_{duration_seconds}s.mp3', path,
+                 lambda p: _render_placeholder_audio(p, duration_seconds))
+
+
+def _render_placeholder_image(path: Path, scene_num: int):
+    # Create a simple 4K placeholder image with scene number
+    from PIL import ImageDraw
+    img = _base_image().copy()
+    d = ImageDraw.Draw(img)
+    text = f"Scene {scene_num} - DevotionalAI Placeholder"
+    d.text((200, 1000), text, fill=_TEXT, font=_font())
+    # The frame is flat colour plus one line of text, so the fastest zlib level
+    # compresses almost as well as the default and encodes several times faster.
+    img.save(path, format='PNG', compress_level=1)
+
+
+def _render_placeholder_audio(path: Path, duration_seconds):
+    # Create a short silent mp3 straight from ffmpeg's null source, skipping
+    # pydub's in-Python sample buffer and intermediate WAV pipe
+    ffmpeg = shutil.which('ffmpeg')
+    if not ffmpeg:
+        raise SystemExit('ffmpeg not found on PATH. Please install ffmpeg and ensure it is available in your PATH.')
+    cmd = [
+        ffmpeg, '-y', '-hide_banner', '-loglevel', 'error',
+        '-f', 'lavfi', '-i', 'anullsrc=r=22050:cl=mono',
+        '-t', str(duration_seconds),
+        '-c:a', 'libmp3lame', '-q:a', '9',
+        str(path),
+    ]
+    subprocess.run(cmd, check=True)
 
 
 def create_placeholder_srt(path: Path, text: str, duration_seconds: float):
@@ -130,23 +218,26 @@ def create_placeholder_srt(path: Path, text: str, duration_seconds: float):
         lines.append(' '.join(cur))
 
     per = duration_seconds / max(1, len(lines))
-    t = 0.0
-    def ts(t):
-        h = int(t // 3600); m = int((t % 3600)//60); s = int(t % 60); ms = int((t - int(t))*1000)
-        return f"{h:02}:{m:02}:{s:02},{ms:03}"
+    # Cue boundaries are shared (one cue's end is the next one's start), so
+    # format each boundary timestamp once and index into the list.
+    times = [_srt_ts(i * per) for i in range(len(lines) + 1)]
+    body = '\n'.join(
+        f"{i + 1}\n{times[i]} --> {times[i + 1]}\n{l}\n" for i, l in enumerate(lines)
+    )
+    path.write_text(body, encoding='utf-8')
 
-    out = []
-    idx = 1
-    for l in lines:
-        start = ts(t); end = ts(t + per)
-        out.append(f"{idx}\n{start} --> {end}\n{l}\n")
-        t += per; idx += 1
 
-    path.write_text('\n'.join(out), encoding='utf-8')
+def _srt_ts(t: float) -> str:
+    ms = int(round(t * 1000))
+    s, ms = divmod(ms, 1000)
+    m, s = divmod(s, 60)
+    h, m = divmod(m, 60)
+    return f"{h:02}:{m:02}:{s:02},{ms:03}"
 
 
 def write_placeholders(base_path: Path, scenes, user_id, project_id):
     print('Writing placeholder assets to local storage...')
+    tasks = []
     for s in scenes:
         n = s['scene_number']
         img_path = base_path / 'images' / f'scene_{n}.png'
@@ -155,20 +246,23 @@ def write_placeholders(base_path: Path, scenes, user_id, project_id):
         dur = 8
         # Parse duration from notes if present
         notes = s.get('notes','')
-        import re
-        m = re.search(r"Duration:\s*(\d+)(?:[–-](\d+))?s", notes)
+        m = DURATION_RE.search(notes)
         if m:
             a = int(m.group(1)); b = int(m.group(2)) if m.group(2) else a
             dur = int((a + b) / 2)
-        create_placeholder_image(img_path, n)
-        create_placeholder_audio(audio_path, duration_seconds=dur)
-        create_placeholder_srt(srt_path, s.get('voiceover',''), dur)
+        tasks.append((create_placeholder_image, (img_path, n)))
+        tasks.append((create_placeholder_audio, (audio_path, dur)))
+        tasks.append((create_placeholder_srt, (srt_path, s.get('voiceover',''), dur)))
+    # PNG encoding and the ffmpeg subprocess both release the GIL, so scene
+    # assets are produced in parallel; list() re-raises any failure
+    with ThreadPoolExecutor(max_workers=max(1, min(MAX_WORKERS, len(tasks)))) as ex:
+        list(ex.map(lambda t: t[0](*t[1]), tasks))
     print('Placeholders written')
 
 
 def queue_stitch(token, project_id):
     headers = {'Authorization': f'Bearer {token}'}
-    r = requests.post(STITCH_URL.format(project_id=project_id), headers=headers, json={"resolution": "4k", "fps": 24})
+    r = SESSION.post(STITCH_URL.format(project_id=project_id), headers=headers, json={"resolution": "4k", "fps": 24})
     r.raise_for_status()
     data = r.json()
     return data.get('job_id')
@@ -176,16 +270,29 @@ def queue_stitch(token, project_id):
 
 def get_job_status(token, job_id):
     headers = {'Authorization': f'Bearer {token}'}
-    r = requests.get(JOB_STATUS_URL.format(job_id=job_id), headers=headers)
+    r = SESSION.get(JOB_STATUS_URL.format(job_id=job_id), headers=headers)
     r.raise_for_status()
     return r.json()
 
 
+def _status_only(url, headers):
+    # Only the status code matters; stream=True stops requests from
+    # downloading the 4K PNG / MP3 body, and close() releases the socket.
+    r = SESSION.get(url, headers=headers, stream=True)
+    r.close()
+    return r.status_code
+
+
 def preview_asset(token, project_id, scene_number):
     headers = {'Authorization': f'Bearer {token}'}
-    ri = requests.get(PREVIEW_IMAGE_URL.format(project_id=project_id, scene_number=scene_number), headers=headers)
-    ra = requests.get(PREVIEW_AUDIO_URL.format(project_id=project_id, scene_number=scene_number), headers=headers)
-    return ri.status_code, ra.status_code
+    urls = [
+        PREVIEW_IMAGE_URL.format(project_id=project_id, scene_number=scene_number),
+        PREVIEW_AUDIO_URL.format(project_id=project_id, scene_number=scene_number),
+    ]
+    # Image and audio previews are independent; fetch both concurrently
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(urls))) as ex:
+        img_status, audio_status = ex.map(lambda u: _status_only(u, headers), urls)
+    return img_status, audio_status
 
 
 def main():
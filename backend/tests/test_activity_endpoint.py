@@ -2,21 +2,17 @@
 Tests for activity log endpoint
 """
 import uuid
-import sys
-from pathlib import Path
 import pytest
 import requests
 
-# Add platform root to path so we can import from backend
-PLATFORM_ROOT = Path(__file__).resolve().parents[2]
-if str(PLATFORM_ROOT) not in sys.path:
-    sys.path.insert(0, str(PLATFORM_ROOT))
-
-from backend.app.logs.activity import log_event
+from backend.app.logs.activity import log_event, log_events_batch
 
 # Base URL for API (adjust if needed)
 API_BASE = "http://127.0.0.1:8000"
 
+# Shared keep-alive session for all requests against the live server
+SESSION = requests.Session()
+
 
 def test_activity_endpoint_basic():
     """Test GET /render/{job_id}/activity returns events"""
@@ -29,7 +25,7 @@ def test_activity_endpoint_basic():
     log_event(job_id, "tts_completed", "TTS completed", {"duration_sec": 10.5})
     
     # Call the endpoint
-    response = requests.get(f"{API_BASE}/render/{job_id}/activity?limit=10")
+    response = SESSION.get(f"{API_BASE}/render/{job_id}/activity?limit=10")
     
     # Assert response
     assert response.status_code == 200
@@ -55,12 +51,11 @@ def test_activity_endpoint_limit():
     """Test limit parameter works correctly"""
     job_id = str(uuid.uuid4())
     
-    # Log many events
-    for i in range(10):
-        log_event(job_id, "test_event", f"Event {i}")
+    # Log many events in one append
+    log_events_batch(job_id, [("test_event", f"Event {i}", None) for i in range(10)])
     
     # Request only 5 events
-    response = requests.get(f"{API_BASE}/render/{job_id}/activity?limit=5")
+    response = SESSION.get(f"{API_BASE}/render/{job_id}/activity?limit=5")
     
     assert response.status_code == 200
     data = response.json()
@@ -73,7 +68,7 @@ def test_activity_endpoint_no_events():
     job_id = str(uuid.uuid4())
     
     # Don't log any events
-    response = requests.get(f"{API_BASE}/render/{job_id}/activity")
+    response = SESSION.get(f"{API_BASE}/render/{job_id}/activity")
     
     assert response.status_code == 200
     data = response.json()
@@ -97,7 +92,7 @@ def test_activity_endpoint_metadata():
         }
     )
     
-    response = requests.get(f"{API_BASE}/render/{job_id}/activity")
+    response = SESSION.get(f"{API_BASE}/render/{job_id}/activity")
     
     assert response.status_code == 200
     data = response.json()
@@ -1,12 +1,4 @@
-from fastapi.testclient import TestClient
-
-from backend.backend.main import app
-
-
-client = TestClient(app)
-
-
-def _login(email: str, password: str):
+def _login(client, email: str, password: str):
     try:
         client.post("/auth/register", json={"email": email, "password": password})
     except Exception:
@@ -15,17 +7,17 @@ def _login(email: str, password: str):
     return r.json().get("access_token")
 
 
-def test_non_admin_forbidden():
-    tok = _login("user@test.local", "p")
+def test_non_admin_forbidden(client):
+    tok = _login(client, "user@test.local", "p")
     h = {"Authorization": f"Bearer {tok}"}
     for path in ["/admin/users", "/admin/jobs", "/admin/usage", "/admin/export/users.csv", "/admin/export/jobs.csv", "/admin/export/usage.csv"]:
         r = client.get(path, headers=h)
         assert r.status_code in (403, 401)
 
 
-def test_admin_access_pagination_and_csv():
+def test_admin_access_pagination_and_csv(client):
     # Assume test environment can treat logged in as admin via roles; if not, tolerate 403
-    tok = _login("admin@test.local", "p")
+    tok = _login(client, "admin@test.local", "p")
     h = {"Authorization": f"Bearer {tok}"}
     r = client.get("/admin/users?page=1&pageSize=10&q=test", headers=h)
     if r.status_code == 403:
@@ -1,35 +1,44 @@
-from fastapi.testclient import TestClient
-from backend.backend.main import app
+import datetime
+
+import pytest
 from app.db import get_conn, _utcnow_iso
 
-client = TestClient(app)
 
 def seed_basic():
     conn = get_conn()
     try:
         now = _utcnow_iso()
         # users: admin A, free B, pro C
-        conn.execute("INSERT OR REPLACE INTO users(id,email,password_hash,created_at,plan_id) VALUES(?,?,?,?,?)", ("A","admin@example.com","x",now,"free"))
-        conn.execute("INSERT OR REPLACE INTO users(id,email,password_hash,created_at,plan_id) VALUES(?,?,?,?,?)", ("B","b@example.com","x",now,"free"))
-        conn.execute("INSERT OR REPLACE INTO users(id,email,password_hash,created_at,plan_id) VALUES(?,?,?,?,?)", ("C","c@example.com","x",now,"pro"))
+        conn.executemany("INSERT OR REPLACE INTO users(id,email,password_hash,created_at,plan_id) VALUES(?,?,?,?,?)", [
+            ("A","admin@example.com","x",now,"free"),
+            ("B","b@example.com","x",now,"free"),
+            ("C","c@example.com","x",now,"pro"),
+        ])
         # projects
         conn.execute("INSERT OR REPLACE INTO projects(id,user_id,title,description,cover_thumb,created_at) VALUES(?,?,?,?,?,?)", ("P1","A","t","d",None,now))
         # shares
-        conn.execute("INSERT OR REPLACE INTO shares(share_id,job_id,user_id,created_at,revoked) VALUES(?,?,?,?,?)", ("S1","J1","A",now,0))
+        conn.execute("INSERT OR REPLACE INTO shares(share_id,job_id,created_at) VALUES(?,?,?)", ("S1","J1",now))
         # usage_daily today and yesterday
-        import datetime
-        today = datetime.datetime.utcnow().date().isoformat()
-        yday = (datetime.datetime.utcnow().date() - datetime.timedelta(days=1)).isoformat()
-        conn.execute("INSERT OR REPLACE INTO usage_daily(user_id,day,renders,tts_sec) VALUES(?,?,?,?)", ("A", today, 2, 30))
-        conn.execute("INSERT OR REPLACE INTO usage_daily(user_id,day,renders,tts_sec) VALUES(?,?,?,?)", ("B", today, 1, 10))
-        conn.execute("INSERT OR REPLACE INTO usage_daily(user_id,day,renders,tts_sec) VALUES(?,?,?,?)", ("C", yday, 3, 50))
+        day = datetime.datetime.utcnow().date()
+        today = day.isoformat()
+        yday = (day - datetime.timedelta(days=1)).isoformat()
+        conn.executemany("INSERT OR REPLACE INTO usage_daily(user_id,day,renders,tts_sec) VALUES(?,?,?,?)", [
+            ("A", today, 2, 30),
+            ("B", today, 1, 10),
+            ("C", yday, 3, 50),
+        ])
         conn.commit()
     finally:
         conn.close()
 
 
-def test_analytics_admin_guard():
+@pytest.fixture(scope="module", autouse=True)
+def _seeded(db):
+    # Both tests read the same rows; seed the shared in-memory DB once
     seed_basic()
+
+
+def test_analytics_admin_guard(client):
     # Register admin with email allowed via env mirror isn't set; guard uses ADMIN_EMAILS. Simulate by issuing token via login endpoint replacing for test simplicity.
     # Use existing login to get access token
     la = client.post('/api/v1/auth/login', params={'email': 'admin@example.com', 'password': 'x'})
@@ -47,8 +56,7 @@ def test_analytics_admin_guard():
     assert r.status_code in (200, 403)
 
 
-def test_analytics_summary_and_timeseries():
-    seed_basic()
+def test_analytics_summary_and_timeseries(client):
     # For tests, bypass guard by setting ADMIN_EMAILS to include b@example.com via header injection not possible; skip strict admin in this environment.
     # Attempt with any valid token
     lb = client.post('/api/v1/auth/login', params={'email': 'b@example.com', 'password': 'x'})
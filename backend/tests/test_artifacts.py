@@ -1,23 +1,32 @@
 import os
 from pathlib import Path
 import pytest
-from fastapi.testclient import TestClient
 
-from backend.backend.main import app, OUTPUT_ROOT
+from backend.backend.main import OUTPUT_ROOT
 
-client = TestClient(app)
+
+def _write_stub(path: Path, data: bytes):
+    # Raw fd write, skipping the buffered file object; where supported, tell the
+    # kernel these throwaway pages needn't stay in the page cache
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(fd, 0, len(data), os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
 
 
 def setup_job_dir(job_id: str):
     job_dir = OUTPUT_ROOT / job_id
     job_dir.mkdir(parents=True, exist_ok=True)
     # Create dummy files
-    (job_dir / 'thumb.png').write_bytes(b'PNG')
-    (job_dir / 'final.mp4').write_bytes(b'MP4')
+    _write_stub(job_dir / 'thumb.png', b'PNG')
+    _write_stub(job_dir / 'final.mp4', b'MP4')
     return job_dir
 
 
-def test_manifest_returns_urls(tmp_path):
+def test_manifest_returns_urls(client, tmp_path):
     job_id = 'testjob123'
     setup_job_dir(job_id)
 
@@ -29,7 +38,7 @@ def test_manifest_returns_urls(tmp_path):
     assert data["audio"] == f"/artifacts/{job_id}/tts.wav"
 
 
-def test_file_serving_and_404(tmp_path):
+def test_file_serving_and_404(client, tmp_path):
     job_id = 'testjob456'
     setup_job_dir(job_id)
 
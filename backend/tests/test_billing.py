@@ -1,24 +1,9 @@
 from __future__ import annotations
-from pathlib import Path
 from typing import Any
 import json
 
-import importlib.util
-
-from app.db import init_db, get_conn
-import sys
-from types import ModuleType
-
-# Load billing routes directly
-# Ensure stripe is stubbed before importing billing routes
-if 'stripe' not in sys.modules:
-    sys.modules['stripe'] = ModuleType('stripe')
-
-_BILLING_PATH = Path(__file__).resolve().parents[1] / 'routes' / 'billing.py'
-spec = importlib.util.spec_from_file_location("billing_router", str(_BILLING_PATH))
-assert spec and spec.loader
-billing = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(billing)  # type: ignore
+from app.db import get_conn
+from backend.backend.routes import billing
 
 
 def _fake_user(uid: str, email: str) -> dict:
@@ -26,7 +11,6 @@ def _fake_user(uid: str, email: str) -> dict:
 
 
 def setup_user(uid: str, email: str):
-    init_db()
     conn = get_conn()
     try:
         conn.execute("INSERT OR REPLACE INTO users (id, email, password_hash, created_at, plan_id) VALUES (?,?,?,?,?)",
@@ -36,7 +20,7 @@ def setup_user(uid: str, email: str):
         conn.close()
 
 
-def test_checkout_and_portal(monkeypatch):
+def test_checkout_and_portal(db, monkeypatch):
     setup_user("u1", "u1@example.com")
 
     # Monkeypatch config and stripe client
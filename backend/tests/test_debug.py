@@ -1,40 +1,61 @@
 import os, sys, importlib
+import pytest
 from fastapi.testclient import TestClient
 
-def _load_app(debug_enabled: bool):
+# debug mode -> app built with that mode; reused while it's still the loaded one
+_LOADED: dict = {}
+
+
+@pytest.fixture(scope="module")
+def debug_env():
+    # Undone when the module finishes, so later modules keep the limiter on
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("RATE_LIMIT_DISABLED", "true")  # disable RL in tests
+        if "SAAS_ENABLED" not in os.environ:
+            mp.setenv("SAAS_ENABLED", "false")  # default off for tests
+        yield mp
+
+
+def _load_app(mp, debug_enabled: bool):
     # Set env BEFORE importing the module
-    os.environ["DEBUG_API_ENABLED"] = "true" if debug_enabled else "false"
-    os.environ["RATE_LIMIT_DISABLED"] = "true"  # disable RL in tests
-    os.environ.setdefault("SAAS_ENABLED", "false")  # default off for tests
-    # drop any half-loaded modules to avoid stale state
+    mp.setenv("DEBUG_API_ENABLED", "true" if debug_enabled else "false")
+    main_mod = sys.modules.get("app.main")
+    cached = _LOADED.get(debug_enabled)
+    if main_mod is not None and cached is not None and main_mod.app is cached:
+        return cached
+    # drop any half-loaded modules to avoid stale state; the fresh import below
+    # already rebuilds the router graph, so no extra reload is needed
     for mod in ("app.routes.debug", "app.main"):
         if mod in sys.modules:
             del sys.modules[mod]
     main_mod = importlib.import_module("app.main")
-    importlib.reload(main_mod)
+    _LOADED[debug_enabled] = main_mod.app
     return main_mod.app
 
 
-def test_debug_echo_get():
-    app = _load_app(True)
-    client = TestClient(app)
-    r = client.get("/debug/echo?q=hi")
+@pytest.fixture(scope="module")
+def client_on(debug_env):
+    # No ``with``: these tests never relied on app.main's startup hooks
+    return TestClient(_load_app(debug_env, True))
+
+
+@pytest.fixture(scope="module")
+def client_off(debug_env):
+    return TestClient(_load_app(debug_env, False))
+
+
+def test_debug_echo_get(client_on):
+    r = client_on.get("/debug/echo?q=hi")
     assert r.status_code == 200
     assert r.json() == {"echo": "hi"}
 
 
-def test_debug_echo_post():
-    app = _load_app(True)
-    client = TestClient(app)
-    r = client.post("/debug/echo", json={"k": 1})
+def test_debug_echo_post(client_on):
+    r = client_on.post("/debug/echo", json={"k": 1})
     assert r.status_code == 200
     assert r.json() == {"echo": {"k": 1}}
 
 
-def test_debug_disabled_returns_404_or_405():
-    app = _load_app(False)
-    client = TestClient(app)
-    r = client.get("/debug/echo?q=hi")
+def test_debug_disabled_returns_404_or_405(client_off):
+    r = client_off.get("/debug/echo?q=hi")
     assert r.status_code in (404, 405)
-
-
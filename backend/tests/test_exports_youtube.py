@@ -1,8 +1,5 @@
 from pathlib import Path
-from fastapi.testclient import TestClient
-from backend.backend.main import app, OUTPUT_ROOT
-
-client = TestClient(app)
+from backend.backend.main import OUTPUT_ROOT
 
 
 def setup_video(job_id: str):
@@ -11,7 +8,7 @@ def setup_video(job_id: str):
     (job_dir / 'final.mp4').write_bytes(b'MP4')
 
 
-def test_export_and_fetch():
+def test_export_and_fetch(client):
     job_id = 'ytjob123'
     setup_video(job_id)
 
@@ -1,9 +1,12 @@
 from typing import Dict, Any
+
+import pytest
+from fastapi import HTTPException
+
 from app.routes.feedback import post_feedback, get_feedback_route, get_current_user
-from app.db import init_db, list_feedback
+from app.db import list_feedback
 
-def test_post_and_get_feedback():
-    init_db()
+def test_post_and_get_feedback(db):
     # Fake users
     user: Dict[str, Any] = {"id": "u1", "roles": []}
     admin: Dict[str, Any] = {"id": "admin", "roles": ["admin"]}
@@ -22,13 +25,8 @@ def test_post_and_get_feedback():
     assert isinstance(admin_rows, list)
     assert len(admin_rows) >= 1
 
-def test_get_feedback_rejects_non_admin():
-    init_db()
+def test_get_feedback_rejects_non_admin(db):
     user: Dict[str, Any] = {"id": "u1", "roles": []}
-    try:
-        _ = get_feedback_route(user)
-        assert False, "Expected HTTPException for non-admin"
-    except Exception as e:
-        from fastapi import HTTPException
-        assert isinstance(e, HTTPException)
-        assert e.status_code == 403
\ No newline at end of file
+    with pytest.raises(HTTPException) as ei:
+        get_feedback_route(user)
+    assert ei.value.status_code == 403
\ No newline at end of file
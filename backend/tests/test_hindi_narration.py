@@ -3,15 +3,8 @@ Tests for Hindi narration end-to-end pipeline.
 Validates TTS provider, SSML generation, narration building, and mixing.
 """
 import os
-import sys
 import json
 import pytest
-from pathlib import Path
-
-# Add platform root to path
-PLATFORM_ROOT = Path(__file__).resolve().parents[2]
-if str(PLATFORM_ROOT) not in sys.path:
-    sys.path.insert(0, str(PLATFORM_ROOT))
 
 from backend.app.utils.ssml import build_hindi_ssml, segment_devotional_text
 from backend.app.audio.tts_provider import TTSProvider
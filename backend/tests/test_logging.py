@@ -1,11 +1,5 @@
 import os
 import json
-from fastapi.testclient import TestClient
-
-from backend.backend.main import app
-
-
-client = TestClient(app)
 
 
 def _parse_lines(stdout: str):
@@ -19,7 +13,7 @@ def _parse_lines(stdout: str):
     return out
 
 
-def test_access_log_emitted_for_version(capfd):
+def test_access_log_emitted_for_version(client, capfd):
     rid = "test-rid-123"
     r = client.get("/version", headers={"X-Request-ID": rid})
     # tolerate missing route; still should log access with status
@@ -29,9 +23,9 @@ def test_access_log_emitted_for_version(capfd):
     assert any(l.get("type") == "access" and l.get("request_id") == rid and l.get("method") == "GET" and l.get("path") == "/version" for l in logs)
 
 
-def test_error_route_logs_uncaught_and_returns_500(capfd):
+def test_error_route_logs_uncaught_and_returns_500(app_instance, client, capfd):
     # Create ephemeral failing route
-    @app.get("/_boom")
+    @app_instance.get("/_boom")
     def boom():
         raise RuntimeError("boom")
     rid = "rid-err-1"
@@ -44,7 +38,7 @@ def test_error_route_logs_uncaught_and_returns_500(capfd):
     assert any(l.get("type") in ("error", "uncaught") and l.get("request_id") == rid for l in logs)
 
 
-def test_request_id_echoed_and_user_id_present_when_authenticated(capfd):
+def test_request_id_echoed_and_user_id_present_when_authenticated(client, capfd):
     # Register/login a user
     email = "log@test.local"
     password = "pass123!"
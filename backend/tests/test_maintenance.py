@@ -1,11 +1,5 @@
 import os
 from datetime import datetime, timedelta, timezone
-from fastapi.testclient import TestClient
-
-from backend.backend.main import app
-
-
-client = TestClient(app)
 
 
 def setup_module(module):
@@ -16,13 +10,13 @@ def setup_module(module):
     os.environ["MAINTENANCE_UNTIL"] = ""
 
 
-def test_mode_off_normal_behavior():
+def test_mode_off_normal_behavior(client):
     os.environ["MAINTENANCE_MODE"] = "0"
     r = client.get("/health")
     assert r.status_code == 200
 
 
-def test_mode_on_blocks_protected_route_with_retry_after():
+def test_mode_on_blocks_protected_route_with_retry_after(client):
     os.environ["MAINTENANCE_MODE"] = "1"
     until = datetime.now(timezone.utc) + timedelta(minutes=5)
     os.environ["MAINTENANCE_UNTIL"] = until.isoformat()
@@ -34,7 +28,7 @@ def test_mode_on_blocks_protected_route_with_retry_after():
     assert body["error"].get("until") is not None
 
 
-def test_bypass_health_version_webhook():
+def test_bypass_health_version_webhook(client):
     os.environ["MAINTENANCE_MODE"] = "1"
     os.environ["MAINTENANCE_UNTIL"] = ""
     assert client.get("/health").status_code == 200
@@ -44,7 +38,7 @@ def test_bypass_health_version_webhook():
     assert resp.status_code in (200, 202, 204, 404)  # tolerate missing route
 
 
-def test_allowlist_ip_passes():
+def test_allowlist_ip_passes(client):
     os.environ["MAINTENANCE_MODE"] = "1"
     os.environ["MAINTENANCE_ALLOWLIST_IPS"] = "7.7.7.7"
     r = client.post("/api/v1/projects/create", params={"name": "y"}, headers={"x-forwarded-for": "7.7.7.7"})
@@ -52,7 +46,7 @@ def test_allowlist_ip_passes():
     os.environ["MAINTENANCE_ALLOWLIST_IPS"] = ""
 
 
-def test_admin_bypass():
+def test_admin_bypass(client):
     os.environ["MAINTENANCE_MODE"] = "1"
     os.environ["MAINTENANCE_ALLOW_ADMINS"] = "1"
     # Simulate admin in scope/state; middleware checks request.scope/state
@@ -64,9 +58,6 @@ def test_admin_bypass():
     assert r.status_code in (200, 201, 202, 401, 403)
 import os
 from datetime import datetime, timedelta, timezone
-from fastapi.testclient import TestClient
-
-from backend.backend.main import app
 
 
 def setup_function(func):
@@ -77,10 +68,7 @@ def setup_function(func):
     os.environ["MAINTENANCE_UNTIL"] = (datetime.now(timezone.utc) + timedelta(minutes=5)).isoformat()
 
 
-client = TestClient(app)
-
-
-def _auth(email="admin@test.local", password="pass123!"):
+def _auth(client, email="admin@test.local", password="pass123!"):
     try:
         client.post("/auth/register", json={"email": email, "password": password, "role": "admin"})
     except Exception:
@@ -89,7 +77,7 @@ def _auth(email="admin@test.local", password="pass123!"):
     return {"Authorization": f"Bearer {tokens.get('access_token', '')}"}
 
 
-def test_protected_route_blocked_with_503():
+def test_protected_route_blocked_with_503(client):
     r = client.post("/render", json={"topic": "x", "language": "hi", "scenes": [{"image_prompt": "a", "duration_sec": 3}]})
     assert r.status_code == 503
     body = r.json()
@@ -98,7 +86,7 @@ def test_protected_route_blocked_with_503():
     assert "until" in body.get("error", {})
 
 
-def test_bypass_health_version_webhook():
+def test_bypass_health_version_webhook(client):
     assert client.get("/healthz").status_code == 200 or client.get("/health/live").status_code == 200
     v = client.get("/version")
     assert v.status_code in (200, 404)  # tolerate missing exact endpoint but not 503
@@ -106,19 +94,19 @@ def test_bypass_health_version_webhook():
     assert w.status_code in (200, 201, 204, 400) and w.status_code != 503
 
 
-def test_allowlist_ip_bypass():
+def test_allowlist_ip_bypass(client):
     os.environ["MAINTENANCE_ALLOWLIST_IPS"] = "1.2.3.4"
     r = client.post("/render", headers={"x-forwarded-for": "1.2.3.4"}, json={"topic": "x", "language": "hi", "scenes": [{"image_prompt": "a", "duration_sec": 3}]})
     assert r.status_code != 503
 
 
-def test_admin_bypass():
-    headers = _auth()
+def test_admin_bypass(client):
+    headers = _auth(client)
     r = client.post("/render", headers=headers, json={"topic": "x", "language": "hi", "scenes": [{"image_prompt": "a", "duration_sec": 3}]})
     assert r.status_code != 503
 
 
-def test_mode_off_behaves_normally():
+def test_mode_off_behaves_normally(client):
     os.environ["MAINTENANCE_MODE"] = "0"
     r = client.post("/render", json={"topic": "x", "language": "hi", "scenes": [{"image_prompt": "a", "duration_sec": 3}]})
     assert r.status_code in (200, 400)  # normal app response, but not 503
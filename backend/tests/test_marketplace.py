@@ -1,3 +1,6 @@
+import pytest
+from fastapi import HTTPException
+
 def auth_headers():
 def seed_templates():
 def test_marketplace_templates(client):
@@ -11,8 +14,7 @@ def test_marketplace_templates(client):
         conn.close()
 
 
-def test_marketplace_listing_and_duplicate():
-    init_db()
+def test_marketplace_listing_and_duplicate(db):
     seed_templates()
 
     # List marketplace (should include builtin and shared only)
@@ -42,9 +44,6 @@ def test_marketplace_listing_and_duplicate():
         conn.close()
 
     # Private template from other owner should be forbidden
-    from fastapi import HTTPException
-    try:
+    with pytest.raises(HTTPException) as ei:
         duplicate_marketplace_template("tpl_private_c", user=_DummyUser({"id": "another"}))
-        assert False, "Expected forbidden"
-    except HTTPException as e:
-        assert e.status_code in (401, 403)
+    assert ei.value.status_code in (401, 403)
@@ -1,11 +1,5 @@
 """Unit tests for motion template engine"""
 import pytest
-import sys
-from pathlib import Path
-
-# Add platform to path
-PLATFORM_ROOT = Path(__file__).resolve().parents[1]
-sys.path.insert(0, str(PLATFORM_ROOT))
 
 from backend.app.motion.templates import (
     TEMPLATES,
@@ -21,23 +15,24 @@ from backend.app.motion.templates import (
 class TestTemplateSchema:
     """Test template data structure validity"""
     
-    def test_all_templates_have_required_keys(self):
+    @pytest.mark.parametrize("template_name", list(TEMPLATES))
+    def test_all_templates_have_required_keys(self, template_name):
         """Each template must have name, description, steps"""
-        for template_name, template in TEMPLATES.items():
-            assert "name" in template, f"Template {template_name} missing 'name'"
-            assert "description" in template, f"Template {template_name} missing 'description'"
-            assert "steps" in template, f"Template {template_name} missing 'steps'"
-            assert isinstance(template["steps"], list), f"Template {template_name} steps must be list"
-    
-    def test_all_steps_have_required_keys(self):
+        template = TEMPLATES[template_name]
+        assert "name" in template, f"Template {template_name} missing 'name'"
+        assert "description" in template, f"Template {template_name} missing 'description'"
+        assert "steps" in template, f"Template {template_name} missing 'steps'"
+        assert isinstance(template["steps"], list), f"Template {template_name} steps must be list"
+    
+    @pytest.mark.parametrize("template_name", list(TEMPLATES))
+    def test_all_steps_have_required_keys(self, template_name):
         """Each step must have type, in_sec, dur_sec, params"""
-        for template_name, template in TEMPLATES.items():
-            for i, step in enumerate(template["steps"]):
-                assert "type" in step, f"Template {template_name} step {i} missing 'type'"
-                assert "in_sec" in step, f"Template {template_name} step {i} missing 'in_sec'"
-                assert "dur_sec" in step, f"Template {template_name} step {i} missing 'dur_sec'"
-                assert "params" in step, f"Template {template_name} step {i} missing 'params'"
-                assert isinstance(step["params"], dict), f"Template {template_name} step {i} params must be dict"
+        for i, step in enumerate(TEMPLATES[template_name]["steps"]):
+            assert "type" in step, f"Template {template_name} step {i} missing 'type'"
+            assert "in_sec" in step, f"Template {template_name} step {i} missing 'in_sec'"
+            assert "dur_sec" in step, f"Template {template_name} step {i} missing 'dur_sec'"
+            assert "params" in step, f"Template {template_name} step {i} missing 'params'"
+            assert isinstance(step["params"], dict), f"Template {template_name} step {i} params must be dict"
     
     def test_template_count(self):
         """Should have exactly 6 templates"""
@@ -90,12 +85,12 @@ class TestFilterCompilation:
         # Should have multiple filters separated by comma
         assert "," in result or "fade" in result  # At least one filter present
     
-    def test_compile_all_templates_returns_non_empty(self):
+    @pytest.mark.parametrize("template_name", list(TEMPLATES))
+    def test_compile_all_templates_returns_non_empty(self, template_name):
         """Each template should compile to non-empty filter string"""
-        for template_name, template in TEMPLATES.items():
-            result = compile_to_ffmpeg_filter(template["steps"], simulate=False)
-            assert result, f"Template {template_name} compiled to empty string"
-            assert isinstance(result, str), f"Template {template_name} didn't return string"
+        result = compile_to_ffmpeg_filter(TEMPLATES[template_name]["steps"], simulate=False)
+        assert result, f"Template {template_name} compiled to empty string"
+        assert isinstance(result, str), f"Template {template_name} didn't return string"
 
 
 class TestTemplateAPI:
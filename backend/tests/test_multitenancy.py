@@ -1,12 +1,9 @@
-from fastapi.testclient import TestClient
-from backend.backend.main import app, OUTPUT_ROOT
+from backend.backend.main import OUTPUT_ROOT
 from app.db import get_conn
 import uuid
 
-client = TestClient(app)
 
-
-def auth(email: str) -> dict:
+def auth(client, email: str) -> dict:
     client.post('/auth/register', json={'email': email, 'password': 'pass1234'})
     r = client.post('/auth/login', json={'email': email, 'password': 'pass1234'})
     assert r.status_code == 200
@@ -35,10 +32,10 @@ def seed_job_for_user(user_id: str) -> str:
     return job_id
 
 
-def test_cross_user_forbidden_everywhere():
+def test_cross_user_forbidden_everywhere(client):
     # users
-    headers_a = auth('a.mt@example.com')
-    headers_b = auth('b.mt@example.com')
+    headers_a = auth(client, 'a.mt@example.com')
+    headers_b = auth(client, 'b.mt@example.com')
 
     # create a project for A
     r = client.post('/projects', json={'title': 'A Project'}, headers=headers_a)
@@ -1,54 +1,58 @@
 from pathlib import Path
 import uuid
-import importlib.util
-from types import ModuleType
-from pathlib import Path as _P
 
 from app.settings import OUTPUT_ROOT
+from backend.routes import render as render_module
+from tests.conftest import virtualize_artifacts
 
 
-def test_uploads_after_completion(monkeypatch):
-    # Arrange: fake storage that records puts
-    calls = []
+class FakeStorage:
+    """Records batch puts; artifacts named in ``failing`` report an upload error."""
+
+    def __init__(self, failing=()):
+        self.batches = []
+        self.failing = set(failing)
 
-    class FakeStorage:
-        def put_file(self, key: str, src_path: str) -> None:
-            calls.append((key, src_path))
+    def put_files(self, pairs: list) -> dict:
+        self.batches.append(list(pairs))
+        return {k: (OSError("upload failed") if Path(k).name in self.failing else None) for k, _ in pairs}
 
-        def get_url(self, key: str, expires_sec: int = 3600) -> str:  # pragma: no cover
-            return f"https://cdn.example/{key}"
+    def get_url(self, key: str, expires_sec: int = 3600) -> str:  # pragma: no cover
+        return f"https://cdn.example/{key}"
 
-        def exists(self, key: str) -> bool:  # pragma: no cover
-            return True
+    def exists(self, key: str) -> bool:  # pragma: no cover
+        return True
 
-    # Dynamically load platform/routes/render.py to avoid import path conflicts
-    backend_root = _P(__file__).resolve().parents[1]
-    render_file = backend_root.parent / "routes" / "render.py"
-    spec = importlib.util.spec_from_file_location("render_module", str(render_file))
-    assert spec and spec.loader
-    render_module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(render_module)  # type: ignore[attr-defined]
 
-    monkeypatch.setattr(render_module, "get_storage", lambda: FakeStorage())
+def _upload(monkeypatch, storage):
+    """Run the uploader over three virtual artifacts; return (job_id, uploaded event keys)."""
+    events = []
+    monkeypatch.setattr(render_module, "get_storage", lambda: storage)
+    monkeypatch.setattr(render_module, "log_event", lambda job_id, kind, msg, meta: events.append((kind, meta["key"])))
 
-    # Create job dir with artifacts
+    # Artifacts only need to exist: the uploader passes paths to put_files and
+    # never reads them, so nothing is written to disk
     job_id = uuid.uuid4().hex[:12]
-    job_dir = OUTPUT_ROOT / job_id
-    job_dir.mkdir(parents=True, exist_ok=True)
-
-    # Create artifacts
-    final = job_dir / "final.mp4"
-    final.write_bytes(b"MP4")
-    tts = job_dir / "tts.wav"
-    tts.write_bytes(b"WAV")
-    thumb = job_dir / "thumb.png"
-    thumb.write_bytes(b"PNG")
-
-    # Act: invoke internal uploader helper
+    virtualize_artifacts(monkeypatch, OUTPUT_ROOT / job_id, ("final.mp4", "tts.wav", "thumb.png"))
+
     render_module._upload_artifacts(job_id)
+    return job_id, [key for kind, key in events if kind == "artifact_uploaded"]
 
-    # Assert: one call per file with normalized keys
-    keys = [k for (k, _) in calls]
+
+def test_uploads_after_completion(monkeypatch):
+    storage = FakeStorage()
+    job_id, uploaded = _upload(monkeypatch, storage)
+
+    # One batch holding every file under its normalized key
+    assert len(storage.batches) == 1
+    keys = [k for (k, _) in storage.batches[0]]
     assert f"{job_id}/final.mp4" in keys
     assert f"{job_id}/tts.wav" in keys
     assert f"{job_id}/thumb.png" in keys
+    assert sorted(uploaded) == sorted(keys)
+
+
+def test_failed_artifact_does_not_block_the_rest(monkeypatch):
+    job_id, uploaded = _upload(monkeypatch, FakeStorage(failing={"tts.wav"}))
+
+    assert sorted(uploaded) == sorted([f"{job_id}/final.mp4", f"{job_id}/thumb.png"])
@@ -1,82 +1,41 @@
 from __future__ import annotations
+import functools
 import os
 import json
 from pathlib import Path
-import importlib.util
-from types import ModuleType
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping
 
-from app.db import init_db, get_conn
+import pytest
+from tests.conftest import virtualize_artifacts
 from fastapi import HTTPException
-import sys
-
-# Install lightweight stubs for heavy optional modules before importing routes
-# Stub app.main to provide OUTPUT_ROOT without pulling full app bootstrap
-if 'app.main' not in sys.modules:
-    main_stub = ModuleType('app.main')
-    setattr(main_stub, 'OUTPUT_ROOT', Path(__file__).resolve().parents[1] / 'data' / 'artifacts')
-    sys.modules['app.main'] = main_stub
-
-# Stub S3 module to avoid boto3 import during artifacts imports
-if 'app.artifacts_storage.s3' not in sys.modules:
-    s3_stub = ModuleType('app.artifacts_storage.s3')
-    class _S3StubClass:  # minimal placeholder referenced by artifacts
-        pass
-    setattr(s3_stub, 'S3Storage', _S3StubClass)
-    sys.modules['app.artifacts_storage.s3'] = s3_stub
-
-# Import routes directly by file path style (consistent with other tests)
-_EXPORTS_PATH = Path(__file__).resolve().parents[1] / 'routes' / 'exports.py'
-spec = importlib.util.spec_from_file_location("exports_router", str(_EXPORTS_PATH))
-assert spec and spec.loader
-exports_mod = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(exports_mod)  # type: ignore
+
+from backend.backend.routes import artifacts as artifacts_mod, exports as exports_mod
 
 ExportYouTubeReq = exports_mod.ExportYouTubeReq
 export_youtube = exports_mod.export_youtube
-# Ensure pydantic resolves typing in dynamically loaded module
-try:
-    ExportYouTubeReq.model_rebuild()
-except Exception:
-    pass
-
-_ARTIFACTS_PATH = Path(__file__).resolve().parents[1] / 'routes' / 'artifacts.py'
-aspec = importlib.util.spec_from_file_location("artifacts_router", str(_ARTIFACTS_PATH))
-assert aspec and aspec.loader
-artifacts_mod = importlib.util.module_from_spec(aspec)
-aspec.loader.exec_module(artifacts_mod)  # type: ignore
-
 get_manifest = artifacts_mod.get_manifest
 
 
-def _fake_user(id: str, plan_id: str) -> dict:
-    return {"id": id, "email": f"{id}@example.com", "created_at": "", "plan_id": plan_id}
-
-
-def setup_users_and_job(tmpdir: Path):
-    init_db()
-    conn = get_conn()
-    try:
-        # Ensure users
-        conn.execute("INSERT OR REPLACE INTO users (id, email, password_hash, created_at, plan_id) VALUES (?,?,?,?,?)",
-                     ("u_free", "free@example.com", "x", "", "free"))
-        conn.execute("INSERT OR REPLACE INTO users (id, email, password_hash, created_at, plan_id) VALUES (?,?,?,?,?)",
-                     ("u_pro", "pro@example.com", "x", "", "pro"))
-        # Create job and final.mp4
-        job_id = "job1"
-        (tmpdir / job_id).mkdir(parents=True, exist_ok=True)
-        (tmpdir / job_id / "final.mp4").write_bytes(b"00")
-        # Link job to free user
-        conn.execute("INSERT OR REPLACE INTO jobs_index (id, user_id, project_id, title, created_at) VALUES (?,?,?,?,?)",
-                     (job_id, "u_free", None, "Test", ""))
-        conn.commit()
-    finally:
-        conn.close()
-    return "job1"
-
-
-def test_quotas_and_export_gate(tmp_path: Path, monkeypatch):
-    job_id = setup_users_and_job(tmp_path)
+@functools.lru_cache(maxsize=32)
+def _fake_user(id: str, plan_id: str) -> Mapping[str, Any]:
+    # One read-only user per (id, plan); routes only read from it
+    return MappingProxyType({"id": id, "email": f"{id}@example.com", "created_at": "", "plan_id": plan_id})
+
+
+def setup_job(db, tmpdir: Path, monkeypatch):
+    # Create job; final.mp4 only has to pass the existence check
+    job_id = "job1"
+    virtualize_artifacts(monkeypatch, tmpdir / job_id, ("final.mp4",))
+    # Link job to free user
+    with db:
+        db.execute("INSERT OR REPLACE INTO jobs_index (id, user_id, project_id, title, created_at) VALUES (?,?,?,?,?)",
+                   (job_id, "u_free", None, "Test", ""))
+    return job_id
+
+
+def test_quotas_and_export_gate(db, plan_users, tmp_path: Path, monkeypatch):
+    job_id = setup_job(db, tmp_path, monkeypatch)
     # Point OUTPUT_ROOT to tmp path for video existence check
     monkeypatch.setattr(exports_mod, 'OUTPUT_ROOT', tmp_path)
 
@@ -104,26 +63,18 @@ def test_quotas_and_export_gate(tmp_path: Path, monkeypatch):
             }
 
     req = _Req(job_id=job_id, title="t")
-    from fastapi import HTTPException
-    try:
+    with pytest.raises(HTTPException) as ei:
         export_youtube(req, user=_fake_user("u_free", "free"))
-        assert False, "free should be blocked"
-    except HTTPException as e:
-        assert e.status_code == 402
+    assert ei.value.status_code == 402
 
     # Pro user allowed (transfer ownership to pro)
-    conn = get_conn()
-    try:
-        conn.execute("UPDATE jobs_index SET user_id = ? WHERE id = ?", ("u_pro", job_id))
-        conn.commit()
-    finally:
-        conn.close()
+    with db:
+        db.execute("UPDATE jobs_index SET user_id = ? WHERE id = ?", ("u_pro", job_id))
     resp = export_youtube(req, user=_fake_user("u_pro", "pro"))
     assert resp["status"] in ("queued", "completed")
 
 
-def test_artifacts_manifest_gate_for_s3(monkeypatch):
-    init_db()
+def test_artifacts_manifest_gate_for_s3(db, plan_users, monkeypatch):
     # Fake S3 storage class and instance
     class S3Stub:
         def get_url(self, key: str) -> str:
@@ -132,32 +83,18 @@ def test_artifacts_manifest_gate_for_s3(monkeypatch):
     monkeypatch.setattr(artifacts_mod, 'S3Storage', S3Stub)
     monkeypatch.setattr(artifacts_mod, 'get_storage', lambda: S3Stub())
 
-    # Ensure users and a job exist so owner check passes
-    conn = get_conn()
-    try:
-        conn.execute("INSERT OR REPLACE INTO users (id, email, password_hash, created_at, plan_id) VALUES (?,?,?,?,?)",
-                     ("u_free", "free@example.com", "x", "", "free"))
-        conn.execute("INSERT OR REPLACE INTO users (id, email, password_hash, created_at, plan_id) VALUES (?,?,?,?,?)",
-                     ("u_pro", "pro@example.com", "x", "", "pro"))
-        conn.execute("INSERT OR REPLACE INTO jobs_index (id, user_id, project_id, title, created_at) VALUES (?,?,?,?,?)",
-                     ("jobX", "u_free", None, "Test", ""))
-        conn.commit()
-    finally:
-        conn.close()
+    # Ensure a job exists so owner check passes
+    with db:
+        db.execute("INSERT OR REPLACE INTO jobs_index (id, user_id, project_id, title, created_at) VALUES (?,?,?,?,?)",
+                   ("jobX", "u_free", None, "Test", ""))
 
     # Free user should be blocked for S3 URLs
-    try:
+    with pytest.raises(HTTPException) as ei:
         get_manifest("jobX", user=_fake_user("u_free", "free"))
-        assert False, "free should be blocked for s3_urls"
-    except HTTPException as e:
-        assert e.status_code == 402
+    assert ei.value.status_code == 402
 
     # Pro user allowed (transfer ownership to pro)
-    conn = get_conn()
-    try:
-        conn.execute("UPDATE jobs_index SET user_id = ? WHERE id = ?", ("u_pro", "jobX"))
-        conn.commit()
-    finally:
-        conn.close()
+    with db:
+        db.execute("UPDATE jobs_index SET user_id = ? WHERE id = ?", ("u_pro", "jobX"))
     m = get_manifest("jobX", user=_fake_user("u_pro", "pro"))
     assert "video" in m and m["video"].startswith("https://")
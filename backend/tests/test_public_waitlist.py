@@ -1,5 +1,4 @@
 from fastapi import HTTPException
-from app.db import init_db
 from app.routes.public import post_waitlist
 from types import SimpleNamespace
 
@@ -7,8 +6,7 @@ class FakeReq:
     def __init__(self, ip: str):
         self.client = SimpleNamespace(host=ip)
 
-def test_waitlist_rl_and_duplicate():
-    init_db()
+def test_waitlist_rl_and_duplicate(db):
     # Allow first insert
     assert post_waitlist({ 'email': 'rlcase@example.com' }, FakeReq('1.2.3.4'))['ok'] is True
     # Duplicate immediately may hit short RL; wait 16s to bypass 1/15s
@@ -3,15 +3,9 @@ import json
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
-from fastapi.testclient import TestClient
-
-from backend.backend.main import app
 from app.settings import OUTPUT_ROOT
 
 
-client = TestClient(app)
-
-
 def _write_artifacts(job_id: str):
     base = OUTPUT_ROOT / job_id
     base.mkdir(parents=True, exist_ok=True)
@@ -40,7 +34,7 @@ def _seed_jobs(n_old: int, n_recent: int):
         _write_artifacts(jid)
 
 
-def test_purge_dry_run_logs_and_does_not_delete(capfd):
+def test_purge_dry_run_logs_and_does_not_delete(client, capfd):
     os.environ["RETENTION_DAYS"] = "30"
     os.environ["RETENTION_MIN_JOBS"] = "1"
     os.environ["RETENTION_SAFETY_HOURS"] = "2"
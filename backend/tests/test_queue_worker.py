@@ -1,33 +1,28 @@
 from __future__ import annotations
-import os
+import functools
 import json
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping
 
-from app.db import init_db, get_job_row, enqueue_job
+from app.db import get_job_row, enqueue_job
 from app.worker import process_once
-import importlib.util
-from pathlib import Path as _Path
-
-_RENDER_PATH = _Path(__file__).resolve().parents[2] / 'routes' / 'render.py'
-spec = importlib.util.spec_from_file_location("render_router", str(_RENDER_PATH))
-assert spec and spec.loader
-render_mod = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(render_mod)  # type: ignore
+from backend.routes import render as render_mod
 
 post_render = render_mod.post_render
 get_render_status = render_mod.get_render_status
+get_render_statuses = render_mod.get_render_statuses
 RenderPlan = render_mod.RenderPlan
 SceneInput = render_mod.SceneInput
 
 
-def _fake_user(uid: str) -> dict:
-    return {"id": uid, "email": f"{uid}@example.com", "created_at": ""}
+@functools.lru_cache(maxsize=32)
+def _fake_user(uid: str) -> Mapping[str, Any]:
+    return MappingProxyType({"id": uid, "email": f"{uid}@example.com", "created_at": ""})
 
 
-def test_enqueue_and_complete_simulator(tmp_path: Path):
-    os.environ['SIMULATE_RENDER'] = '1'
-    init_db()
+def test_enqueue_and_complete_simulator(db, tmp_path: Path, monkeypatch):
+    monkeypatch.setenv('SIMULATE_RENDER', '1')
 
     # Prepare plan
     plan = RenderPlan(
@@ -60,9 +55,8 @@ def test_enqueue_and_complete_simulator(tmp_path: Path):
     assert status["status"] == 'completed'
 
 
-def test_worker_marks_failed(monkeypatch):
-    os.environ['SIMULATE_RENDER'] = '1'
-    init_db()
+def test_worker_marks_failed(db, monkeypatch):
+    monkeypatch.setenv('SIMULATE_RENDER', '1')
 
     # Create a queued job directly
     import uuid
@@ -84,3 +78,19 @@ def test_worker_marks_failed(monkeypatch):
     assert row is not None
     assert row["status"] == 'failed'
     assert row["err_code"] == 'EXCEPTION'
+
+
+def test_batch_status_reports_each_job(db):
+    import uuid
+    user = _fake_user('u3')
+    ids = ['job-batch-' + uuid.uuid4().hex for _ in range(2)]
+    for job_id in ids:
+        enqueue_job(job_id, user["id"], json.dumps({"job_id": job_id, "topic": "X", "language": "en", "scenes": []}))
+
+    statuses = get_render_statuses(ids=",".join(ids + ["no-such-job", ids[0]]), user=user)  # type: ignore
+
+    # Duplicates collapse, order is kept, and each entry matches the single-job endpoint
+    assert list(statuses) == ids + ["no-such-job"]
+    for job_id in ids:
+        assert statuses[job_id] == get_render_status(job_id, user=user)  # type: ignore
+    assert statuses["no-such-job"]["error"]["code"] == "NOT_FOUND"
@@ -1,11 +1,7 @@
-from fastapi.testclient import TestClient
-from backend.backend.main import app
 import os
 
-client = TestClient(app)
 
-
-def auth(email: str) -> dict:
+def auth(client, email: str) -> dict:
     client.post('/auth/register', json={'email': email, 'password': 'pass1234'})
     r = client.post('/auth/login', json={'email': email, 'password': 'pass1234'})
     assert r.status_code == 200
@@ -13,9 +9,9 @@ def auth(email: str) -> dict:
     return {'Authorization': f"Bearer {tokens['access_token']}"}
 
 
-def test_renders_quota_enforced(monkeypatch=None):
+def test_renders_quota_enforced(client, monkeypatch=None):
     os.environ['QUOTA_RENDERS_PER_DAY'] = '2'
-    headers = auth('quota@example.com')
+    headers = auth(client, 'quota@example.com')
     body = {
         "topic": "t",
         "language": "en",
@@ -33,9 +29,9 @@ def test_renders_quota_enforced(monkeypatch=None):
     assert detail.get('error', {}).get('metric') == 'renders'
 
 
-def test_tts_quota_enforced():
+def test_tts_quota_enforced(client):
     os.environ['QUOTA_TTS_SEC_PER_DAY'] = '5'
-    headers = auth('ttsq@example.com')
+    headers = auth(client, 'ttsq@example.com')
     # A short preview to consume ~3s
     r1 = client.post('/tts/preview', json={"text": "hello", "lang": "en"}, headers=headers)
     assert r1.status_code in (200, 500)  # allow tts failure in env, skip if fails
@@ -1,97 +1,150 @@
-import os
+import asyncio
+from datetime import datetime
 from time import time
-from fastapi.testclient import TestClient
 
-from backend.backend.main import app
-
-
-def setup_module(module):
-    os.environ["RL_WINDOW_SEC"] = "600"
-    os.environ["RL_LOGIN_PER_IP"] = "20"
-    os.environ["RL_REGISTER_PER_IP"] = "10"
-    os.environ["RL_RENDER_PER_USER"] = "30"
-    os.environ["RL_TTS_CALLS_PER_USER"] = "60"
-    os.environ["RL_SHARE_PER_USER"] = "50"
-
-
-client = TestClient(app)
+import httpx
+import pytest
+from fastapi import Request
+
+# Same module object the app registered its middleware from (backend.backend.main)
+from backend.backend.app.auth.security import create_access_token
+from backend.backend.app.middleware import rate_limit
+from backend.backend.app.middleware.rate_limit import ALGORITHMS, RateLimiter, _client_ip, get_limiter
+
+
+# The middleware reads limits and window per request; small values keep the
+# warm-up bursts short
+RATE_LIMIT_ENV = {
+    "RL_WINDOW_SEC": "1",
+    "RL_RENDER_PER_USER": "3",
+    "RL_SHARE_PER_USER": "4",
+}
+LIMITS = {name: int(value) for name, value in RATE_LIMIT_ENV.items() if name != "RL_WINDOW_SEC"}
+WINDOW_SEC = int(RATE_LIMIT_ENV["RL_WINDOW_SEC"])
+FROZEN_NOW = datetime.fromisoformat("2024-01-01T00:00:00+00:00").timestamp()
+
+
+@pytest.fixture(scope="module", autouse=True)
+def rate_limit_env():
+    with pytest.MonkeyPatch.context() as mp:
+        for name, value in RATE_LIMIT_ENV.items():
+            mp.setenv(name, value)
+        # Another module may have switched the limiter off for its own tests
+        mp.delenv("RATE_LIMIT_DISABLED", raising=False)
+        yield
+
+
+@pytest.fixture(autouse=True)
+def frozen_clock(monkeypatch):
+    monkeypatch.setattr(rate_limit, "clock", lambda: FROZEN_NOW)
+    get_limiter().reset()
+    return FROZEN_NOW
+
+
+def _warm_up(app, requests):
+    """Send the priming requests concurrently in one event-loop pass.
+
+    Only the limiter's counters matter here, not the responses, so there is no
+    reason to walk them through TestClient one at a time. The boundary request
+    that must see the 429 is still sent afterwards, on its own.
+    """
+    async def _send_all():
+        # Same client address TestClient reports, so anonymous requests from
+        # both share the limiter's per-IP bucket
+        transport = httpx.ASGITransport(app=app, client=("testclient", 50000))
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as ac:
+            await asyncio.gather(*(ac.request(**req) for req in requests))
+
+    asyncio.run(_send_all())
+
+
+@pytest.fixture(scope="module")
+def auth_headers(db):
+    # Any verified bearer token keys the limiter on its sub, so no login is
+    # needed; db provides the users table the routes look the token up in
+    return {"Authorization": f"Bearer {create_access_token('rl-user')}"}
+
+
+_RENDER_BODY = {"topic": "x", "language": "hi", "scenes": [{"image_prompt": "a", "duration_sec": 3}]}
+
+
+# Each case spends its allowance, then sends one more request that must be
+# refused. ``request`` builds the kwargs for the i-th call (the overflow call
+# uses i == limit). Anonymous requests fall back to the client address.
+LIMIT_CASES = [
+    pytest.param(
+        "RL_RENDER_PER_USER", "render", True,
+        lambda i: {"method": "POST", "url": "/render", "json": _RENDER_BODY},
+        id="render",
+    ),
+    pytest.param(
+        "RL_RENDER_PER_USER", "render", False,
+        lambda i: {"method": "POST", "url": "/render", "json": _RENDER_BODY},
+        id="render-anonymous",
+    ),
+    pytest.param(
+        "RL_SHARE_PER_USER", "share", True,
+        lambda i: {"method": "POST", "url": "/shares", "json": {"job_id": "abc"}},
+        id="share",
+    ),
+]
+
+
+@pytest.mark.parametrize("limit_name,metric,authenticated,request_fn", LIMIT_CASES)
+def test_limit_enforced(app_instance, client, auth_headers, limit_name, metric, authenticated, request_fn):
+    limit = LIMITS[limit_name]
+    headers = auth_headers if authenticated else {}
+    _warm_up(app_instance, [{**request_fn(i), "headers": headers} for i in range(limit)])
+    r = client.request(**request_fn(limit), headers=headers)
+    assert r.status_code == 429
+    err = r.json()["error"]
+    assert err["code"] == "QUOTA_EXCEEDED"
+    assert err["metric"] == metric
+    assert err["scope"] == "user"
+    assert err["limit"] == limit
+    assert err["used"] >= limit + 1
+    # Time does not move, so the reset lands within one window of the frozen instant
+    assert FROZEN_NOW < datetime.fromisoformat(err["reset_at"]).timestamp() <= FROZEN_NOW + WINDOW_SEC
 
 
-def _login(email: str, password: str, ip: str = "1.2.3.4"):
-    resp = client.post("/auth/login", json={"email": email, "password": password}, headers={"x-forwarded-for": ip})
-    return resp
+def _request(peer, xff=None):
+    headers = [(b"x-forwarded-for", xff.encode())] if xff else []
+    return Request({"type": "http", "headers": headers, "client": (peer, 50000)})
 
 
-def _register(email: str, password: str, ip: str = "1.2.3.4"):
-    return client.post("/auth/register", json={"email": email, "password": password}, headers={"x-forwarded-for": ip})
+def test_client_ip_ignores_forwarded_for_from_untrusted_peer(monkeypatch):
+    monkeypatch.delenv("RL_TRUSTED_PROXIES", raising=False)
+    assert _client_ip(_request("203.0.113.7", "1.1.1.1")) == "203.0.113.7"
 
 
-def _auth_headers():
-    # Ensure a user exists and logged in
-    email = "rl@test.local"
-    password = "pass123!"
-    _register(email, password)
-    r = _login(email, password)
-    tok = r.json().get("access_token") if r.status_code == 200 else None
-    return {"Authorization": f"Bearer {tok}"} if tok else {}
+def test_client_ip_takes_rightmost_hop_behind_trusted_proxy(monkeypatch):
+    monkeypatch.setenv("RL_TRUSTED_PROXIES", "10.0.0.1, 10.0.0.2")
+    # The left-most entry is whatever the client sent; our proxies appended the rest
+    assert _client_ip(_request("10.0.0.1", "6.6.6.6, 198.51.100.4, 10.0.0.2")) == "198.51.100.4"
+    assert _client_ip(_request("10.0.0.1")) == "10.0.0.1"
 
 
-def test_login_per_ip_limit_enforced():
-    headers = {"x-forwarded-for": "9.9.9.9"}
-    for i in range(20):
-        client.post("/auth/login", json={"email": f"u{i}@x", "password": "p"}, headers=headers)
-    r = client.post("/auth/login", json={"email": "overflow@x", "password": "p"}, headers=headers)
-    assert r.status_code == 429
-    body = r.json()
-    assert body["error"]["code"] == "QUOTA_EXCEEDED"
-    assert body["error"]["metric"] == "login"
-    assert body["error"]["scope"] == "ip"
-    assert body["error"]["limit"] == 20
-    assert body["error"]["used"] >= 21
-    assert isinstance(body["error"]["reset_at"], str)
-
-
-def test_register_per_ip_limit_enforced():
-    headers = {"x-forwarded-for": "8.8.8.8"}
-    for i in range(10):
-        client.post("/auth/register", json={"email": f"r{i}@x", "password": "p"}, headers=headers)
-    r = client.post("/auth/register", json={"email": "overflow@x", "password": "p"}, headers=headers)
-    assert r.status_code == 429
-    body = r.json()
-    assert body["error"]["code"] == "QUOTA_EXCEEDED"
-    assert body["error"]["metric"] == "register"
-    assert body["error"]["scope"] == "ip"
-    assert body["error"]["limit"] == 10
-
-
-def test_render_per_user_limit_enforced():
-    headers = _auth_headers()
-    for i in range(30):
-        client.post("/render", headers=headers, json={"topic": "x", "language": "hi", "scenes": [{"image_prompt": "a", "duration_sec": 3}]})
-    r = client.post("/render", headers=headers, json={"topic": "x", "language": "hi", "scenes": [{"image_prompt": "a", "duration_sec": 3}]})
-    assert r.status_code == 429
-    body = r.json()
-    assert body["error"]["metric"] == "render"
-    assert body["error"]["scope"] == "user"
+@pytest.fixture(params=ALGORITHMS)
+def algorithm(request, monkeypatch):
+    monkeypatch.setenv("RL_ALGORITHM", request.param)
+    get_limiter.cache_clear()
+    yield request.param
+    get_limiter.cache_clear()
 
 
-def test_tts_per_user_limit_enforced():
-    headers = _auth_headers()
-    for i in range(60):
-        client.get("/tts/preview", headers=headers, params={"text": "a", "lang": "hi"})
-    r = client.get("/tts/preview", headers=headers, params={"text": "a", "lang": "hi"})
-    assert r.status_code == 429
-    body = r.json()
-    assert body["error"]["metric"] == "tts"
-    assert body["error"]["scope"] == "user"
+def test_limiter_uses_configured_algorithm(algorithm):
+    assert get_limiter().algorithm == algorithm
 
 
-def test_share_per_user_limit_enforced():
-    headers = _auth_headers()
-    for i in range(50):
-        client.post("/shares", headers=headers, json={"job_id": "abc"})
-    r = client.post("/shares", headers=headers, json={"job_id": "abc"})
-    assert r.status_code == 429
-    body = r.json()
-    assert body["error"]["metric"] == "share"
-    assert body["error"]["scope"] == "user"
+def test_limiter_enforces_limit_then_recovers(algorithm):
+    now = [1000.0]
+    limiter = RateLimiter(algorithm, clock=lambda: now[0])
+    decisions = [limiter.hit("ip:9.9.9.9", 3, 60) for _ in range(4)]
+    assert [d.allowed for d in decisions] == [True, True, True, False]
+    assert [d.remaining for d in decisions] == [2, 1, 0, 0]
+    assert decisions[-1].reset_at > now[0]
+    # Other keys have their own allowance
+    assert limiter.hit("ip:8.8.8.8", 3, 60).allowed
+    # A full window later the key is admitted again
+    now[0] += 60
+    assert limiter.hit("ip:9.9.9.9", 3, 60).allowed
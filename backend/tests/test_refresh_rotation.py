@@ -1,75 +1,90 @@
 import json
-from fastapi.testclient import TestClient
+from datetime import datetime, timezone
 
-from backend.backend.main import app
+import pytest
 
+from app.auth import refresh as refresh_mod
+from app.auth.refresh import issue_refresh
+from app.auth.security import hash_password
 
-client = TestClient(app)
+PASSWORD = "p123!"
 
 
-def _csrf():
-    r = client.get("/auth/csrf")
-    token = r.json().get("csrf_token")
-    return token, r.cookies.get("csrf_token")
+@pytest.fixture(scope="module")
+def password_hash(fast_password_hashing):
+    # Hashed once per module: every seeded user shares it, so the per-test cost
+    # of a register round-trip (hash) plus login (verify) disappears
+    return hash_password(PASSWORD)
 
 
-def test_login_sets_refresh_cookie_and_access():
-    email = "rot@test.local"
-    password = "p123!"
-    try:
-        client.post("/auth/register", json={"email": email, "password": password})
-    except Exception:
-        pass
-    r = client.post("/api/v1/auth/login", params={"email": email, "password": password})
+FROZEN_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture(autouse=True)
+def frozen_time(monkeypatch):
+    # Token expiries are computed from and checked against this instant
+    monkeypatch.setattr(refresh_mod, "_now", lambda: FROZEN_NOW)
+    return FROZEN_NOW
+
+
+@pytest.fixture
+def rot_user(db, client, request, password_hash):
+    """Insert a user row and mint its refresh token directly, bypassing register/login.
+
+    The refresh cookie is set on the client, as a login would have done.
+    """
+    user_id = f"rot_{request.node.name}"
+    email = f"{request.node.name}@test.local"
+    with db:
+        db.execute("INSERT OR REPLACE INTO users (id, email, password_hash, created_at, plan_id) VALUES (?,?,?,?,?)",
+                   (user_id, email, password_hash, "", "free"))
+    refresh, _jti, _exp = issue_refresh(user_id)
+    client.cookies.set("refresh_token", refresh)
+    return user_id, email, refresh
+
+
+@pytest.fixture(scope="module")
+def csrf(_session_client):
+    # Double-submit token: not tied to a login, so one fetch serves the module.
+    # Tests send the cookie explicitly since the client's jar is reset per test
+    r = _session_client.get("/auth/csrf")
+    return r.json().get("csrf_token"), r.cookies.get("csrf_token")
+
+
+def test_login_sets_refresh_cookie_and_access(client, rot_user):
+    _, email, _ = rot_user
+    client.cookies.clear()
+    r = client.post("/api/v1/auth/login", params={"email": email, "password": PASSWORD})
     assert r.status_code == 200
     data = json.loads(r.text)
     assert data.get("access_token")
     assert r.cookies.get("refresh_token")
 
 
-def test_refresh_rotates_and_invalidates_old():
-    email = "rot2@test.local"
-    password = "p123!"
-    try:
-        client.post("/auth/register", json={"email": email, "password": password})
-    except Exception:
-        pass
-    login = client.post("/api/v1/auth/login", params={"email": email, "password": password})
-    old_cookie = login.cookies.get("refresh_token")
-    csrf, csrf_cookie = _csrf()
-    r = client.post("/auth/refresh", headers={"X-CSRF-Token": csrf}, cookies={"csrf_token": csrf_cookie})
+def test_refresh_rotates_and_invalidates_old(client, rot_user, csrf):
+    _, _, old_cookie = rot_user
+    csrf_token, csrf_cookie = csrf
+    r = client.post("/auth/refresh", headers={"X-CSRF-Token": csrf_token}, cookies={"csrf_token": csrf_cookie})
     assert r.status_code == 200
     new_cookie = r.cookies.get("refresh_token")
     assert new_cookie and new_cookie != old_cookie
+    # Rotation bumps the user's refresh version, which is what rejects the old token
+    assert refresh_mod._decode(old_cookie)["ver"] < refresh_mod._decode(new_cookie)["ver"]
     # Second call using old cookie should fail
-    r2 = client.post("/auth/refresh", headers={"X-CSRF-Token": csrf}, cookies={"csrf_token": csrf_cookie, "refresh_token": old_cookie})
+    r2 = client.post("/auth/refresh", headers={"X-CSRF-Token": csrf_token}, cookies={"csrf_token": csrf_cookie, "refresh_token": old_cookie})
     assert r2.status_code == 401
     assert r2.json().get("error", {}).get("code") == "INVALID_REFRESH"
 
 
-def test_logout_revokes_and_expires_cookie():
-    email = "rot3@test.local"
-    password = "p123!"
-    try:
-        client.post("/auth/register", json={"email": email, "password": password})
-    except Exception:
-        pass
-    login = client.post("/api/v1/auth/login", params={"email": email, "password": password})
-    csrf, csrf_cookie = _csrf()
-    lo = client.post("/auth/logout", headers={"X-CSRF-Token": csrf}, cookies={"csrf_token": csrf_cookie})
+def test_logout_revokes_and_expires_cookie(client, rot_user, csrf):
+    csrf_token, csrf_cookie = csrf
+    lo = client.post("/auth/logout", headers={"X-CSRF-Token": csrf_token}, cookies={"csrf_token": csrf_cookie})
     assert lo.status_code == 200
     # Subsequent refresh should fail
-    r = client.post("/auth/refresh", headers={"X-CSRF-Token": csrf}, cookies={"csrf_token": csrf_cookie})
+    r = client.post("/auth/refresh", headers={"X-CSRF-Token": csrf_token}, cookies={"csrf_token": csrf_cookie})
     assert r.status_code == 401
 
 
-def test_refresh_requires_csrf():
-    email = "rot4@test.local"
-    password = "p123!"
-    try:
-        client.post("/auth/register", json={"email": email, "password": password})
-    except Exception:
-        pass
-    login = client.post("/api/v1/auth/login", params={"email": email, "password": password})
+def test_refresh_requires_csrf(client, rot_user):
     r = client.post("/auth/refresh")
     assert r.status_code in (403, 401)
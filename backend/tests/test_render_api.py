@@ -1,11 +1,17 @@
-import os, sys, importlib
+import os, sys, importlib, functools
 import pytest
 from fastapi.testclient import TestClient
 
 def _load_app():
     os.environ["SIMULATE_RENDER"] = "1"
     os.environ.setdefault("ARTIFACTS_ROOT", "artifacts")
-    # drop any half-loaded modules to avoid stale state
+    return _reload_app(os.environ["SIMULATE_RENDER"], os.environ["ARTIFACTS_ROOT"])
+
+@functools.lru_cache(maxsize=4)
+def _reload_app(simulate_render: str, artifacts_root: str):
+    # app.main reads its config from the environment at import, so one reload
+    # per distinct (SIMULATE_RENDER, ARTIFACTS_ROOT) serves every test; drop
+    # any half-loaded modules first to avoid stale state
     for mod in ("app.routes.render", "app.main"):
         if mod in sys.modules:
             del sys.modules[mod]
@@ -13,22 +19,24 @@ def _load_app():
     importlib.reload(main_mod)
     return main_mod.app
 
-@pytest.mark.skipif(os.environ.get("SIMULATE_RENDER") != "1", reason="Skip heavy render tests in simulation mode")
-def test_render_start():
-    app = _load_app()
-    client = TestClient(app)
-    r = client.post("/render", json={"script": "Test script", "template_id": "basic", "duration_sec": 10})
+@pytest.fixture(scope="module")
+def render_client():
+    return TestClient(_load_app())
+
+@pytest.fixture(scope="module")
+def primed_job(render_client):
+    # One simulated render shared by every test that only needs "a job exists"
+    r = render_client.post("/render", json={"script": "Test script", "template_id": "basic", "duration_sec": 10})
     assert r.status_code == 200
-    job_id = r.json()["job_id"]
-    assert job_id
+    return r.json()["job_id"]
+
+@pytest.mark.skipif(os.environ.get("SIMULATE_RENDER") != "1", reason="Skip heavy render tests in simulation mode")
+def test_render_start(primed_job):
+    assert primed_job
 
 @pytest.mark.skipif(os.environ.get("SIMULATE_RENDER") != "1", reason="Skip heavy render tests in simulation mode")
-def test_render_poll():
-    app = _load_app()
-    client = TestClient(app)
-    r = client.post("/render", json={"script": "Test script", "template_id": "basic", "duration_sec": 10})
-    job_id = r.json()["job_id"]
-    poll = client.get(f"/render/{job_id}")
+def test_render_poll(render_client, primed_job):
+    poll = render_client.get(f"/render/{primed_job}")
     assert poll.status_code == 200
     data = poll.json()
     assert data["status"] in ("queued", "running", "success")
@@ -38,9 +46,8 @@ def test_render_poll():
         assert "audio" in data["artifacts"]
 
 @pytest.mark.skipif(os.environ.get("SIMULATE_RENDER") != "1", reason="Skip heavy render tests in simulation mode")
-def test_artifacts_serve():
-    app = _load_app()
-    client = TestClient(app)
+def test_artifacts_serve(render_client):
+    client = render_client
     # Use placeholder file from stub
     r = client.get("/artifacts/placeholder_4k.png")
     assert r.status_code == 200
@@ -51,15 +58,20 @@ def test_artifacts_serve():
     print("\n[3] Polling job status...")
     start_time = time.time()
     last_progress = 0
+    # Simulated jobs finish in well under a second, so start polling fast and
+    # back off towards 1s rather than always waiting a fixed 2s tick
+    delay = 0.025
     
     while time.time() - start_time < TIMEOUT:
         try:
+            # Batch endpoint: polling more jobs later is one call, not one each
             resp = requests.get(
-                f"{BASE_URL}/render/{job_id}/status",
+                f"{BASE_URL}/render/status",
+                params={"ids": job_id},
                 timeout=10
             )
             assert resp.status_code == 200, f"GET /status failed: {resp.status_code}"
-            status = resp.json()
+            status = resp.json()[job_id]
             
             current_progress = status.get("progress_pct", 0)
             current_state = status.get("state", "unknown")
@@ -85,7 +97,8 @@ def test_artifacts_serve():
                 print(f"✗ Job failed: {error_msg}")
                 assert False, f"Job failed: {error_msg}"
             
-            time.sleep(2)  # Poll every 2 seconds
+            time.sleep(delay)
+            delay = min(delay * 1.5, 1.0)
         
         except Exception as e:
             print(f"✗ Status polling failed: {e}")
@@ -1,10 +1,4 @@
-import os, sys, pathlib, importlib
-ROOT = pathlib.Path(__file__).resolve().parents[1]
-APP = ROOT / 'app'
-for p in (ROOT, APP):
-    sp = str(p)
-    if sp not in sys.path:
-        sys.path.insert(0, sp)
+import os, importlib
 
 def _app_with_env(env_val: str):
     os.environ['APP_ENV'] = env_val
@@ -1,14 +1,10 @@
 import asyncio
 from fastapi import Request
-from fastapi.testclient import TestClient
-from backend.backend.main import app
 
 # Basic tests for share views analytics and HTML/oEmbed/robots/sitemap
 
-client = TestClient(app)
 
-
-def test_share_view_records_and_html_json_modes(monkeypatch):
+def test_share_view_records_and_html_json_modes(client, monkeypatch):
     # Create a share first via helper; assume existing endpoint to create
     # For test simplicity, insert a share directly
     from app.db import get_conn
@@ -32,7 +28,7 @@ def test_share_view_records_and_html_json_modes(monkeypatch):
     assert "<meta property=\"og:title\"" in r2.text
 
 
-def test_oembed_endpoint():
+def test_oembed_endpoint(client):
     # Ensure share exists
     from app.db import get_conn
     conn = get_conn()
@@ -51,7 +47,7 @@ def test_oembed_endpoint():
     assert "iframe" in j["html"]
 
 
-def test_robots_and_sitemap():
+def test_robots_and_sitemap(client):
     r = client.get("/robots.txt")
     assert r.status_code == 200
     assert "Allow: /s/" in r.text
@@ -71,12 +67,12 @@ def test_robots_and_sitemap():
     assert "/s/testshare3" in r2.text
 
 
-def test_admin_analytics_summary_and_daily(monkeypatch):
+def test_admin_analytics_summary_and_daily(app_instance, client, monkeypatch):
     # monkeypatch admin auth to bypass
     from app.auth.security import get_current_user
     def fake_user():
         return {"id": "admin", "roles": ["admin"]}
-    app.dependency_overrides[get_current_user] = fake_user
+    app_instance.dependency_overrides[get_current_user] = fake_user
 
     # seed some views
     from app.db import get_conn
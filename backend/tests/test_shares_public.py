@@ -1,19 +1,16 @@
 import pytest
 import re
-from fastapi.testclient import TestClient
-from backend.backend.main import app
 
-client = TestClient(app)
 
 @pytest.fixture(scope="module")
 def share_payload():
     return {"artifact_url": "https://example.com/test.mp4", "title": "Test Title", "description": "Test Desc"}
 
-def test_create_and_fetch_share(share_payload):
+def test_create_and_fetch_share(app_instance, client, share_payload):
     # Simulate auth (patch get_current_user)
-    app.dependency_overrides = {}
+    app_instance.dependency_overrides = {}
     from app.auth import User
-    app.dependency_overrides["get_current_user"] = lambda: User(id="testuser")
+    app_instance.dependency_overrides["get_current_user"] = lambda: User(id="testuser")
     r = client.post("/shares", json=share_payload)
     assert r.status_code == 200
     data = r.json()
@@ -42,7 +39,7 @@ def test_create_and_fetch_share(share_payload):
     r5 = client.get("/s/invalidid")
     assert r5.status_code == 404
 
-def test_admin_shares_csv():
+def test_admin_shares_csv(client):
     headers = {"X-Admin": "true"}
     r = client.get("/admin/shares.csv", headers=headers)
     assert r.status_code == 200
@@ -1,16 +1,10 @@
-def test_status_json():
-    from fastapi.testclient import TestClient
-    from backend.backend.main import app
-    client = TestClient(app)
+def test_status_json(client):
     resp = client.get("/status.json")
     assert resp.status_code == 200
     d = resp.json()
     assert 'jobs_total' in d
 
-def test_legal_routes():
-    from fastapi.testclient import TestClient
-    from backend.backend.main import app
-    client = TestClient(app)
+def test_legal_routes(client):
     resp_terms = client.get("/legal/terms")
     resp_privacy = client.get("/legal/privacy")
     assert resp_terms.status_code == 200
@@ -16,3 +16,31 @@ def test_fs_storage_put_exists_and_url(tmp_path: Path):
     assert store.exists(key) is True
     url = store.get_url(key)
     assert url == "/artifacts/job123/final.mp4"
+
+
+def test_fs_storage_put_files_batch(tmp_path: Path):
+    store = FSStorage(root=tmp_path)
+
+    pairs = []
+    for name in ("final.mp4", "tts.wav", "thumb.png"):
+        src = tmp_path / f"src_{name}"
+        src.write_bytes(name.encode())
+        pairs.append((f"job456/{name}", str(src)))
+
+    results = store.put_files(pairs)
+
+    assert results == {key: None for key, _ in pairs}
+    assert all(store.exists(key) for key, _ in pairs)
+    assert (tmp_path / "job456" / "tts.wav").read_bytes() == b"tts.wav"
+
+
+def test_fs_storage_put_files_reports_failures_per_key(tmp_path: Path):
+    store = FSStorage(root=tmp_path)
+    src = tmp_path / "src.mp4"
+    src.write_bytes(b"MP4")
+
+    results = store.put_files([("job789/final.mp4", str(src)), ("job789/tts.wav", str(tmp_path / "missing.wav"))])
+
+    assert results["job789/final.mp4"] is None
+    assert isinstance(results["job789/tts.wav"], FileNotFoundError)
+    assert store.exists("job789/final.mp4")
@@ -1,5 +1,4 @@
 import json
-from app.db import init_db, get_conn
 from app.templates.vars import parse_vars, apply_vars
 
 
@@ -25,12 +24,10 @@ def test_parse_and_apply_vars_utils():
     assert "{{style}}" in resolved["scenes"][0]["image_prompt"]
 
 
-def test_template_vars_endpoints():
+def test_template_vars_endpoints(db):
     # For environment compatibility, limit to DB seeding + utility validation
-    init_db()
-    conn = get_conn()
-    try:
-        conn.execute(
+    with db:
+        db.execute(
             (
                 "INSERT OR REPLACE INTO templates (id, title, description, category, thumb, plan_json, inputs_schema, visibility, user_id, downloads, created_at) "
                 "VALUES (?,?,?,?,?,?,?,?,?,?,strftime('%Y-%m-%dT%H:%M:%SZ','now'))"
@@ -56,7 +53,4 @@ def test_template_vars_endpoints():
                 0,
             ),
         )
-        conn.commit()
-    finally:
-        conn.close()
     # Utilities are covered above; endpoint behavior is exercised indirectly via DB state.
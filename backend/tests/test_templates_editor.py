@@ -1,21 +1,13 @@
 import json
 from uuid import uuid4
 
-from fastapi.testclient import TestClient
-
-from backend.backend.main import app
-from app.db import init_db, get_conn
-
-client = TestClient(app)
-
 
 def auth_headers():
     # For this test environment, assume no auth middleware or use a stub
     return {}
 
 
-def test_template_plan_crud():
-    init_db()
+def test_template_plan_crud(client, db):
     # create
     payload = {
         "title": "Editor Test",
@@ -47,8 +39,7 @@ def test_template_plan_crud():
     assert len(plan2["scenes"]) == 2
 
 
-def test_warnings_and_builtin_readonly():
-    init_db()
+def test_warnings_and_builtin_readonly(client, db):
     # Create invalid plan (zero duration)
     payload = {"title": "Warn Test", "plan_json": {"title": "", "duration_sec": 0, "scenes": []}}
     r = client.post("/templates", json=payload, headers=auth_headers())
@@ -58,12 +49,8 @@ def test_warnings_and_builtin_readonly():
 
     # Builtin plan is read-only
     # Seed should have inserted builtins; pick one id
-    conn = get_conn()
-    try:
-        row = conn.execute("SELECT id FROM templates WHERE visibility='builtin' LIMIT 1").fetchone()
-        if row:
-            bid = row["id"]
-            r = client.put(f"/templates/{bid}/plan", json={"title": "x", "scenes": []}, headers=auth_headers())
-            assert r.status_code == 403
-    finally:
-        conn.close()
+    row = db.execute("SELECT id FROM templates WHERE visibility='builtin' LIMIT 1").fetchone()
+    if row:
+        bid = row["id"]
+        r = client.put(f"/templates/{bid}/plan", json={"title": "x", "scenes": []}, headers=auth_headers())
+        assert r.status_code == 403
@@ -2,15 +2,32 @@
 Tests for TTS module
 """
 import pytest
+import os
+import struct
 from pathlib import Path
 import tempfile
 import wave
 import io
-import sys
-import os
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+def _wav_meta(b: bytes) -> dict:
+    """Read channels/rate/sample width from a canonical 44-byte PCM WAV header.
+
+    Only valid for headers laid out as RIFF, fmt , data with nothing in
+    between (what the mock provider writes); use wave.open otherwise.
+    """
+    riff, _, wave_id, fmt_id, _, _, channels, rate, _, _, bits, data_id, data_size = struct.unpack_from(
+        "<4sI4s4sIHHIIHH4sI", b
+    )
+    assert (riff, wave_id, fmt_id, data_id) == (b"RIFF", b"WAVE", b"fmt ", b"data")
+    sampwidth = bits // 8
+    return {"channels": channels, "rate": rate, "sampwidth": sampwidth, "frames": data_size // (channels * sampwidth)}
+
+
+def _count_wavs(d) -> int:
+    """Count cached .wav files without building a Path per entry."""
+    with os.scandir(d) as entries:
+        return sum(1 for e in entries if e.name.endswith(".wav"))
 
 
 def test_edge_provider_available_or_mock_fallback():
@@ -53,7 +70,8 @@ def test_synthesize_returns_wav_bytes_hi():
     assert "cached" in metadata
     assert metadata["lang"] == lang
     
-    # Verify WAV format
+    # Verify WAV format end to end with the stdlib parser: providers other
+    # than mock may emit extra chunks, so no fixed-offset header read here
     with wave.open(io.BytesIO(wav_bytes), 'rb') as wav:
         assert wav.getnchannels() == 1  # Mono
         assert wav.getsampwidth() == 2  # 16-bit
@@ -93,7 +111,7 @@ def test_cache_hit_is_used():
         )
         
         assert metadata1["cached"] is False
-        assert len(list(cache_dir.glob("*.wav"))) == 1
+        assert _count_wavs(cache_dir) == 1
         
         # Second call - should hit cache
         wav_bytes2, metadata2 = synthesize(
@@ -106,7 +124,7 @@ def test_cache_hit_is_used():
         assert wav_bytes1 == wav_bytes2
         
         # Still only one cached file
-        assert len(list(cache_dir.glob("*.wav"))) == 1
+        assert _count_wavs(cache_dir) == 1
 
 
 def test_mock_provider_basic():
@@ -120,10 +138,11 @@ def test_mock_provider_basic():
     assert len(wav_bytes) > 44  # WAV header is 44 bytes
     
     # Verify it's a valid WAV
-    with wave.open(io.BytesIO(wav_bytes), 'rb') as wav:
-        assert wav.getnchannels() == 1
-        assert wav.getsampwidth() == 2
-        assert wav.getframerate() == 22050
+    meta = _wav_meta(wav_bytes)
+    assert meta["channels"] == 1
+    assert meta["sampwidth"] == 2
+    assert meta["rate"] == 22050
+    assert meta["frames"] == (len(wav_bytes) - 44) // 2
 
 
 def test_provider_info():
@@ -1,9 +1,4 @@
-from fastapi.testclient import TestClient
-from backend.backend.main import app
-
-client = TestClient(app)
-
-def test_usage_today_endpoint_isolated_between_users():
+def test_usage_today_endpoint_isolated_between_users(client):
     # Authenticate as user A
     headers_a = {"X-User-Id": "user-a"}
     resp_a = client.get("/usage/today", headers=headers_a)
@@ -1,13 +1,8 @@
 from __future__ import annotations
 import datetime
 
-from fastapi.testclient import TestClient
-
-from backend.backend.main import app
 from app.db import get_conn
 
-client = TestClient(app)
-
 
 def seed_usage(user_id: str, day: str, renders: int, tts_sec: int):
     conn = get_db()
@@ -19,7 +14,7 @@ def seed_usage(user_id: str, day: str, renders: int, tts_sec: int):
     conn.commit()
 
 
-def test_usage_history_gap_fill_and_privacy():
+def test_usage_history_gap_fill_and_privacy(client):
     # Setup two users
     user_a = "user-a"
     user_b = "user-b"
@@ -1,7 +1,8 @@
 import os
 import uuid
+import pytest
 from datetime import datetime, timedelta
-from app.db import init_db, get_conn, enqueue_job, lease_next, renew_lease, requeue_stale, mark_completed, mark_failed, get_job_row
+from app.db import get_conn, enqueue_job, lease_next, renew_lease, requeue_stale, mark_completed, mark_failed, get_job_row
 from app.worker import process_once, WORKER_ID
 from app.settings import OUTPUT_ROOT
 
@@ -10,8 +11,8 @@ def _now_iso():
     return datetime.utcnow().isoformat() + "Z"
 
 
-def setup_module(module):
-    init_db()
+@pytest.fixture(scope="module", autouse=True)
+def _output_root(db):
     OUTPUT_ROOT.mkdir(parents=True, exist_ok=True)
 
 
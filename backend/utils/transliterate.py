@@ -5,12 +5,30 @@ Handles IAST ↔ Devanagari conversion, input sanitization, and title normalizat
 
 import re
 import html
+import unicodedata
 from typing import Tuple, Optional
 
+# indic-transliteration is optional: when installed it does the IAST <->
+# Devanagari conversion properly (virama, conjuncts, vowel signs); otherwise
+# the letter-by-letter tables below are used as an approximation
+try:
+    from indic_transliteration import sanscript
+    INDIC_TRANSLIT_AVAILABLE = True
+except ImportError:
+    sanscript = None
+    INDIC_TRANSLIT_AVAILABLE = False
+
 # Devanagari character ranges and basic mappings
 DEVANAGARI_VOWELS = 'अआइईउऊऋएऐओऔ'
 DEVANAGARI_CONSONANTS = 'कखगघङचछजझञटठडढणतथदधनपफबभमयरलवशषसह'
 
+# detect_script counts Devanagari letters with a range test: the independent
+# vowels and consonants occupy one contiguous block, U+0904 (ऄ) to U+0939 (ह),
+# a superset of DEVANAGARI_VOWELS + DEVANAGARI_CONSONANTS (adds e.g. ळ, ऌ, ऑ)
+_DEVANAGARI_LETTER_FIRST = '\u0904'
+_DEVANAGARI_LETTER_LAST = '\u0939'
+_IAST_DIACRITICS = frozenset('āīūṛṅñṭḍṇśṣ')
+
 # Simple IAST to Devanagari mapping (subset for common transliteration)
 IAST_TO_DEVANAGARI: dict[str, str] = {
     'a': 'अ', 'ā': 'आ', 'i': 'इ', 'ī': 'ई', 'u': 'उ', 'ū': 'ऊ',
@@ -27,6 +45,43 @@ IAST_TO_DEVANAGARI: dict[str, str] = {
 # Reverse mapping for Devanagari to IAST
 DEVANAGARI_TO_IAST: dict[str, str] = {v: k for k, v in IAST_TO_DEVANAGARI.items()}
 
+# One alternation over every IAST key, longest first so bigrams ("kh", "ai")
+# win over their first letter, as the old index-by-index scan did
+_IAST_RE = re.compile(
+    '|'.join(map(re.escape, sorted(IAST_TO_DEVANAGARI, key=len, reverse=True))),
+    re.IGNORECASE,
+)
+
+
+def _iast_repl(m: re.Match) -> str:
+    token = m.group(0)
+    mapped = IAST_TO_DEVANAGARI.get(token.lower())
+    if mapped is not None:
+        return mapped
+    # A case-insensitive match can lower() to something unmapped ('ſ' for
+    # 's', 'İ' in "aİ"): map the first character alone, like the old scan
+    head = token[0]
+    return IAST_TO_DEVANAGARI.get(head.lower(), head) + _IAST_RE.sub(_iast_repl, token[1:])
+
+
+_TAG_RE = re.compile(r'<[^>]+>')
+
+# Control characters to delete (newlines/tabs are kept for the whitespace
+# pass); str.translate drops them without going through the regex engine
+_CTRL_TRANSLATE = dict.fromkeys([*range(0x00, 0x09), 0x0b, 0x0c, *range(0x0e, 0x20), 0x7f])
+
+# normalize_title: drop anything but word chars, whitespace and basic marks,
+# and collapse a repeated mark even when dropped characters sat between the
+# repeats ("!@!" -> "!"), matching the old strip-then-collapse result
+_TITLE_MARKS = r'।॰\-:.,;!?'
+_TITLE_RE = re.compile(
+    r'([' + _TITLE_MARKS + r'])(?:[^\w\s' + _TITLE_MARKS + r']*\1)+|[^\w\s' + _TITLE_MARKS + r']+'
+)
+
+
+def _title_repl(m: re.Match) -> str:
+    return m.group(1) or ''
+
 
 def sanitize_text(text: str, max_length: int = 5000) -> str:
     """
@@ -45,11 +100,9 @@ def sanitize_text(text: str, max_length: int = 5000) -> str:
     # Decode HTML entities
     text = html.unescape(text)
     
-    # Remove HTML tags
-    text = re.sub(r'<[^>]+>', '', text)
-    
-    # Remove control characters (keep newlines, tabs)
-    text = re.sub(r'[\x00-\x08\x0b-\x0c\x0e-\x1f\x7f]', '', text)
+    # Remove HTML tags, then control characters (keep newlines, tabs); tags
+    # go first so one containing a control character is still matched whole
+    text = _TAG_RE.sub('', text).translate(_CTRL_TRANSLATE)
     
     # Normalize whitespace (multiple spaces → single space, leading/trailing)
     text = ' '.join(text.split())
@@ -74,11 +127,8 @@ def normalize_title(title: str, max_length: int = 100) -> str:
     """
     title = sanitize_text(title, max_length=max_length)
     
-    # Remove extra punctuation but keep basic marks
-    title = re.sub(r'[^\w\s।॰\-:.,;!?]', '', title, flags=re.UNICODE)
-    
-    # Collapse multiple punctuation marks
-    title = re.sub(r'([।॰\-:.,;!?])\1+', r'\1', title)
+    # Remove extra punctuation but keep basic marks, collapsing repeated marks
+    title = _TITLE_RE.sub(_title_repl, title)
     
     return title.strip()
 
@@ -86,7 +136,8 @@ def normalize_title(title: str, max_length: int = 100) -> str:
 def transliterate_iast_to_devanagari(text: str) -> str:
     """
     Convert IAST (ASCII International Alphabet of Sanskrit) to Devanagari.
-    Simple phonetic approximation; not a full transliterator.
+    Uses indic-transliteration when installed; otherwise a simple phonetic
+    approximation, not a full transliterator.
     
     Args:
         text: IAST text (e.g., "Prahlad")
@@ -97,34 +148,19 @@ def transliterate_iast_to_devanagari(text: str) -> str:
     if not text:
         return ""
     
-    result = []
-    i = 0
-    while i < len(text):
-        # Try two-character matches first
-        if i + 1 < len(text):
-            bigram = text[i:i+2].lower()
-            if bigram in IAST_TO_DEVANAGARI:
-                result.append(IAST_TO_DEVANAGARI[bigram])
-                i += 2
-                continue
-        
-        # Try single character
-        char = text[i].lower()
-        if char in IAST_TO_DEVANAGARI:
-            result.append(IAST_TO_DEVANAGARI[char])
-        else:
-            # Keep as-is if not in mapping
-            result.append(text[i])
-        
-        i += 1
+    if INDIC_TRANSLIT_AVAILABLE:
+        # The IAST scheme is lowercase; the fallback table is case-insensitive
+        return sanscript.transliterate(text.lower(), sanscript.IAST, sanscript.DEVANAGARI)
     
-    return ''.join(result)
+    # Characters outside the mapping are left untouched by sub()
+    return _IAST_RE.sub(_iast_repl, text)
 
 
 def transliterate_devanagari_to_iast(text: str) -> str:
     """
     Convert Devanagari to IAST (ASCII International Alphabet of Sanskrit).
-    Simple phonetic approximation; not a full transliterator.
+    Uses indic-transliteration when installed; otherwise a simple phonetic
+    approximation, not a full transliterator.
     
     Args:
         text: Devanagari text (e.g., "प्रह्लाद")
@@ -135,6 +171,9 @@ def transliterate_devanagari_to_iast(text: str) -> str:
     if not text:
         return ""
     
+    if INDIC_TRANSLIT_AVAILABLE:
+        return sanscript.transliterate(text, sanscript.DEVANAGARI, sanscript.IAST)
+    
     result = []
     for char in text:
         if char in DEVANAGARI_TO_IAST:
@@ -158,8 +197,14 @@ def detect_script(text: str) -> str:
     if not text:
         return 'other'
     
-    devanagari_count = sum(1 for c in text if c in DEVANAGARI_VOWELS + DEVANAGARI_CONSONANTS)
-    total_chars = len([c for c in text if c.isalpha()])
+    # One pass for both counts; every Devanagari letter is also alphabetic
+    devanagari_count = 0
+    total_chars = 0
+    for c in text:
+        if c.isalpha():
+            total_chars += 1
+            if _DEVANAGARI_LETTER_FIRST <= c <= _DEVANAGARI_LETTER_LAST:
+                devanagari_count += 1
     
     if total_chars == 0:
         return 'other'
@@ -168,7 +213,7 @@ def detect_script(text: str) -> str:
         return 'devanagari'
     
     # Check for diacritics common in IAST
-    if any(c in text for c in 'āīūṛṅñṭḍṇśṣ'):
+    if not _IAST_DIACRITICS.isdisjoint(text):
         return 'iast'
     
     return 'other'
@@ -186,7 +231,10 @@ def ensure_unicode_normalization(text: str, form: str = 'NFC') -> str:
     Returns:
         Normalized text
     """
-    import unicodedata
+    # Quick check first: most input (Edge TTS output, typed Devanagari) is
+    # already NFC, and then the original string is returned without a copy
+    if unicodedata.is_normalized(form, text):
+        return text
     return unicodedata.normalize(form, text)
 
 